@@ -0,0 +1,78 @@
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import event
+
+from feast_rest_registry import interface
+
+import common
+
+
+def time_applies(registry, project: str, names, description: str, threads: int):
+    def apply(name):
+        try:
+            registry._apply_served_object(
+                interface.PostableResourceType.entity,
+                project,
+                name,
+                common.application(common.entity_proto(project, name, description)),
+            )
+            return True
+        except Exception:
+            return False
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        succeeded = list(executor.map(apply, names))
+    return time.perf_counter() - start, succeeded.count(False)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the rate of single object applications.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    common.add_registry_arguments(parser)
+    parser.add_argument("--objects", type=int, default=500)
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=3,
+        help="The number of times each object is applied (the first inserts, the rest update).",
+    )
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+
+    engine_path = common.engine_path(parser, args)
+    registry = interface.ServedSqlRegistry(engine_path=engine_path, cache_max_bytes=0)
+    if args.engine_path is not None:
+        registry.teardown()
+
+    statements = []
+    event.listen(
+        registry.engine,
+        "before_cursor_execute",
+        lambda *_: statements.append(None),
+    )
+
+    project = "bench_apply"
+    names = [f"entity_{i}" for i in range(args.objects)]
+    for round_index in range(args.rounds):
+        statements.clear()
+        elapsed, failures = time_applies(
+            registry, project, names, f"round {round_index}", args.threads
+        )
+        print(json.dumps({
+            "round": round_index,
+            "kind": "insert" if round_index == 0 else "update",
+            "threads": args.threads,
+            "applies_per_second": args.objects / elapsed,
+            "statements_per_apply": len(statements) / args.objects,
+            "failures": failures,
+        }))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import argparse
+import json
+import random
+import time
+from datetime import datetime
+
+from feast_rest_registry import interface
+
+import common
+
+
+def time_lookups(registry: interface.ServedSqlRegistry, args, rng: random.Random):
+    views_per_project = args.rows // args.projects
+    since = datetime.utcnow()
+
+    def project():
+        return f"project_{rng.randrange(args.projects)}"
+
+    lookups = {
+        "get": lambda: registry._get_served_object_bytes(
+            interface.GettableResourceType.feature_view,
+            project(),
+            f"feature_view_{rng.randrange(views_per_project)}",
+        ),
+        "list": lambda: registry._list_served_object_bytes(
+            interface.QueryableResourceType.feature_view, project()
+        ),
+        "changes": lambda: registry._list_served_changes(project(), since),
+        "resources": lambda: registry._list_served_resources(
+            interface.QueryableResourceType.feature_view, project=project(), limit=10
+        ),
+    }
+    results = {}
+    for lookup, call in lookups.items():
+        latencies = []
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            call()
+            latencies.append(time.perf_counter() - start)
+        results[lookup] = common.latency_percentiles(latencies)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark hot-path lookups with and without the registry's indexes.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    common.add_registry_arguments(parser)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--projects", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    engine_path = common.engine_path(parser, args)
+
+    # caching would hide the database from repeated lookups
+    registry = interface.ServedSqlRegistry(engine_path=engine_path, cache_max_bytes=0)
+    if args.engine_path is not None:
+        registry.teardown()
+
+    views_per_project = args.rows // args.projects
+    for project_index in range(args.projects):
+        project = f"project_{project_index}"
+        registry._apply_served_objects(
+            project,
+            [
+                common.batch_application(
+                    "feature_view",
+                    f"feature_view_{i}",
+                    common.feature_view_proto(project, f"feature_view_{i}"),
+                )
+                for i in range(views_per_project)
+            ],
+        )
+
+    with registry.engine.begin() as conn:
+        for index in interface._registry_indexes():
+            index.drop(conn, checkfirst=True)
+    print(json.dumps({
+        "indexes": False,
+        "rows": args.rows,
+        **time_lookups(registry, args, random.Random(args.seed)),
+    }))
+
+    start = time.perf_counter()
+    registry._create_indexes()
+    index_seconds = time.perf_counter() - start
+    print(json.dumps({
+        "indexes": True,
+        "rows": args.rows,
+        "index_creation_seconds": index_seconds,
+        **time_lookups(registry, args, random.Random(args.seed)),
+    }))
+
+
+if __name__ == "__main__":
+    main()
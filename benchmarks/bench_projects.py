@@ -0,0 +1,75 @@
+import argparse
+import json
+import time
+
+from fastapi.testclient import TestClient
+
+from feast_rest_registry import server
+
+import common
+
+
+def time_requests(client: TestClient, path: str, repeats: int):
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        response = client.get(path)
+        latencies.append(time.perf_counter() - start)
+        assert response.status_code == 200, response.text
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark GET /projects as the volume of stored protos grows.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    common.add_registry_arguments(parser)
+    parser.add_argument("--projects", type=int, default=10)
+    parser.add_argument(
+        "--feature-views",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000],
+        help="The cumulative numbers of feature views per project to measure at.",
+    )
+    parser.add_argument("--proto-size", type=int, default=16 * 1024)
+    parser.add_argument("--repeats", type=int, default=50)
+    args = parser.parse_args()
+
+    engine_path = common.engine_path(parser, args)
+    app, registry = server.get_app(engine_path, cache_max_bytes=0)
+    if args.engine_path is not None:
+        registry.teardown()
+    client = TestClient(app)
+
+    results = []
+    seeded = 0
+    for feature_view_count in sorted(args.feature_views):
+        for project_index in range(args.projects):
+            project = f"project_{project_index}"
+            registry._apply_served_objects(
+                project,
+                [
+                    common.batch_application(
+                        "feature_view",
+                        f"feature_view_{i}",
+                        common.feature_view_proto(project, f"feature_view_{i}", args.proto_size),
+                    )
+                    for i in range(seeded, feature_view_count)
+                ],
+            )
+        seeded = feature_view_count
+
+        latencies = time_requests(client, "/projects", args.repeats)
+        results.append({
+            "feature_views_per_project": feature_view_count,
+            "proto_megabytes": args.projects * feature_view_count * args.proto_size / 2**20,
+            **common.latency_percentiles(latencies),
+            "max_ms": max(latencies) * 1000,
+        })
+        print(json.dumps(results[-1]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+import argparse
+import json
+import random
+import subprocess
+import time
+from datetime import datetime
+
+import httpx
+from fastapi.testclient import TestClient
+from sqlalchemy.engine import make_url
+
+from feast.protos.feast.core.SavedDataset_pb2 import SavedDataset as SavedDatasetProto
+
+from feast_rest_registry import interface, server
+
+import common
+
+
+def saved_dataset_proto(project: str, name: str) -> bytes:
+    proto = SavedDatasetProto()
+    proto.spec.name = name
+    proto.spec.project = project
+    proto.spec.features.extend([f"feature_view_0:feature_{i}" for i in range(10)])
+    return proto.SerializeToString()
+
+
+def seed(apply_objects, args):
+    for project_index in range(args.projects):
+        project = f"project_{project_index}"
+        objs = [
+            common.batch_application(
+                "entity", f"entity_{i}", common.entity_proto(project, f"entity_{i}")
+            )
+            for i in range(args.entities)
+        ] + [
+            common.batch_application(
+                "feature_view",
+                f"feature_view_{i}",
+                common.feature_view_proto(project, f"feature_view_{i}", args.proto_size),
+            )
+            for i in range(args.feature_views)
+        ] + [
+            common.batch_application(
+                "saved_dataset",
+                f"saved_dataset_{i}",
+                saved_dataset_proto(project, f"saved_dataset_{i}"),
+            )
+            for i in range(args.saved_datasets)
+        ]
+        apply_objects(project, objs)
+
+
+def summarise(operation: str, mode: str, latencies):
+    return {
+        "operation": operation,
+        "mode": mode,
+        "count": len(latencies),
+        "ops_per_second": len(latencies) / sum(latencies),
+        **common.latency_percentiles(latencies),
+    }
+
+
+def time_calls(calls):
+    latencies = []
+    for call in calls:
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def check(response):
+    assert response.status_code == 200, response.text
+    return response
+
+
+def in_process_calls(registry: interface.ServedSqlRegistry, args, rng: random.Random):
+    def project():
+        return f"project_{rng.randrange(args.projects)}"
+
+    def apply(i):
+        proj = project()
+        name = f"feature_view_{rng.randrange(args.feature_views)}"
+        return lambda: registry._apply_served_proto(
+            interface.PostableResourceType.feature_view,
+            proj,
+            name,
+            common.feature_view_proto(proj, name, args.proto_size, revision=i + 1),
+            datetime.utcnow(),
+        )
+
+    def get(_):
+        proj = project()
+        name = f"feature_view_{rng.randrange(args.feature_views)}"
+        return lambda: registry._get_served_object(
+            interface.GettableResourceType.feature_view, proj, name
+        )
+
+    def list_(_):
+        proj = project()
+        return lambda: registry._list_served_objects(
+            interface.QueryableResourceType.feature_view, proj
+        )
+
+    def projects(_):
+        return lambda: registry._list_served_projects()
+
+    def resources(_):
+        return lambda: registry._list_served_resources(limit=100)
+
+    def delete(i):
+        return lambda: registry._delete_served_object(
+            interface.DeletableResourceType.entity, "project_delete", f"in_process_{i}"
+        )
+
+    return {
+        "apply": apply,
+        "get": get,
+        "list": list_,
+        "projects": projects,
+        "resources": resources,
+        "delete": delete,
+    }
+
+
+def http_calls(client: httpx.Client, args, rng: random.Random):
+    def project():
+        return f"project_{rng.randrange(args.projects)}"
+
+    def apply(i):
+        proj = project()
+        name = f"feature_view_{rng.randrange(args.feature_views)}"
+        content = common.feature_view_proto(proj, name, args.proto_size, revision=i + 1)
+        return lambda: check(client.post(
+            f"/{proj}",
+            params={"resource": "feature_view", "name": name},
+            content=content,
+            headers={"Content-Type": interface.PROTOBUF_MEDIA_TYPE},
+        ))
+
+    def get(_):
+        proj = project()
+        name = f"feature_view_{rng.randrange(args.feature_views)}"
+        return lambda: check(client.get(
+            f"/{proj}", params={"resource": "feature_view", "name": name}
+        ))
+
+    def list_(_):
+        proj = project()
+        return lambda: check(client.get(
+            f"/{proj}/list", params={"resource": "feature_view"}
+        ))
+
+    def projects(_):
+        return lambda: check(client.get("/projects"))
+
+    def resources(_):
+        return lambda: check(client.get("/resources", params={"limit": 100}))
+
+    def delete(i):
+        return lambda: check(client.delete(
+            "/project_delete", params={"resource": "entity", "name": f"http_{i}"}
+        ))
+
+    return {
+        "apply": apply,
+        "get": get,
+        "list": list_,
+        "projects": projects,
+        "resources": resources,
+        "delete": delete,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the registry's operations in-process and over HTTP.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    common.add_registry_arguments(parser)
+    parser.add_argument(
+        "--url",
+        type=str,
+        default=None,
+        help="The URL of a running server on the same database, instead of an in-process test client.",
+    )
+    parser.add_argument("--projects", type=int, default=5)
+    parser.add_argument("--entities", type=int, default=20)
+    parser.add_argument("--feature-views", type=int, default=200)
+    parser.add_argument("--saved-datasets", type=int, default=20)
+    parser.add_argument("--proto-size", type=int, default=4 * 1024)
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument(
+        "--operations",
+        nargs="+",
+        default=["apply", "get", "list", "projects", "resources", "delete"],
+    )
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        default=["in_process", "http"],
+    )
+    parser.add_argument(
+        "--cache-max-bytes",
+        type=int,
+        default=0,
+        help="The object cache of the in-process registry (disabled to measure the database).",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=str, default=None, help="The JSON file to write.")
+    args = parser.parse_args()
+
+    if args.url is not None:
+        common.require_destroy(parser, args, "--url")
+        if args.engine_path is None and "in_process" in args.modes:
+            parser.error("The in_process mode needs the --engine-path of the --url server's database.")
+
+    # The in-process registry is only built where it is used, a running
+    # server being benchmarked (and seeded) through its API alone
+    engine_path = args.engine_path
+    if args.url is None or "in_process" in args.modes:
+        engine_path = common.engine_path(parser, args)
+        app, registry = server.get_app(engine_path, cache_max_bytes=args.cache_max_bytes)
+
+    if args.url is None:
+        client = TestClient(app)
+        apply_objects = registry._apply_served_objects
+        if args.engine_path is not None:
+            registry.teardown()
+    else:
+        client = httpx.Client(base_url=args.url)
+
+        def apply_objects(project, objs):
+            check(client.post(
+                f"/{project}/batch", json=[json.loads(obj.json()) for obj in objs]
+            ))
+        check(client.delete("/teardown"))
+
+    start = time.perf_counter()
+    seed(apply_objects, args)
+    # The entities removed by the delete benchmark, one per repeat and mode
+    apply_objects(
+        "project_delete",
+        [
+            common.batch_application(
+                "entity", f"{mode}_{i}", common.entity_proto("project_delete", f"{mode}_{i}")
+            )
+            for mode in args.modes
+            for i in range(args.repeats)
+        ],
+    )
+    seed_seconds = time.perf_counter() - start
+
+    results = []
+    for mode in args.modes:
+        rng = random.Random(args.seed)
+        if mode == "in_process":
+            calls = in_process_calls(registry, args, rng)
+        elif mode == "http":
+            calls = http_calls(client, args, rng)
+        else:
+            raise ValueError(f"Unknown mode '{mode}'.")
+
+        for operation in args.operations:
+            operation_calls = [calls[operation](i) for i in range(args.repeats)]
+            results.append(summarise(operation, mode, time_calls(operation_calls)))
+            print(json.dumps(results[-1]))
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.utcnow().isoformat(),
+        # unknown for a server on an unnamed database
+        "engine": None if engine_path is None else make_url(engine_path).get_backend_name(),
+        # without the database password
+        "arguments": dict(
+            vars(args),
+            engine_path=None if engine_path is None else repr(make_url(engine_path)),
+        ),
+        "seed_seconds": seed_seconds,
+        "results": results,
+    }
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
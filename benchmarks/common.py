@@ -0,0 +1,84 @@
+import argparse
+import base64
+import os
+import statistics
+import tempfile
+from datetime import datetime
+from typing import Dict, List
+
+from feast.protos.feast.core.Entity_pb2 import Entity as EntityProto
+from feast.protos.feast.core.FeatureView_pb2 import FeatureView as FeatureViewProto
+
+from feast_rest_registry import interface
+
+
+def add_registry_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--engine-path",
+        type=str,
+        default=None,
+        help="The SQL alchemy engine path of the registry (a temporary SQLite file by default).",
+    )
+    parser.add_argument(
+        "--destroy",
+        action="store_true",
+        help="Tear down the given registry before seeding it, deleting all of its projects.",
+    )
+
+
+def require_destroy(parser: argparse.ArgumentParser, args, option: str):
+    # Only a temporary registry, created by the benchmark, is torn down unasked
+    if not args.destroy:
+        parser.error(
+            f"The registry at {option} is torn down before seeding, "
+            "deleting all of its projects: pass --destroy to do so."
+        )
+
+
+def engine_path(parser: argparse.ArgumentParser, args) -> str:
+    if args.engine_path is None:
+        return f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'registry.db')}"
+    require_destroy(parser, args, "--engine-path")
+    return args.engine_path
+
+
+def entity_proto(project: str, name: str, description: str = "") -> bytes:
+    proto = EntityProto()
+    proto.spec.name = name
+    proto.spec.project = project
+    proto.spec.join_key = f"{name}_id"
+    proto.spec.description = description
+    return proto.SerializeToString()
+
+
+def feature_view_proto(project: str, name: str, proto_size: int = 0, revision: int = 0) -> bytes:
+    proto = FeatureViewProto()
+    proto.spec.name = name
+    proto.spec.project = project
+    proto.spec.entities.append("entity_0")
+    # pad the proto to a realistic size with an opaque description
+    proto.spec.description = f"{revision}:" + "x" * proto_size
+    return proto.SerializeToString()
+
+
+def application(proto_bytes: bytes) -> interface.ApplicationObject:
+    return interface.ApplicationObject(
+        proto=base64.b64encode(proto_bytes).decode("ascii"),
+        last_updated_timestamp=datetime.utcnow().isoformat(),
+    )
+
+
+def batch_application(resource: str, name: str, proto_bytes: bytes):
+    return interface.BatchApplicationObject(
+        resource=interface.PostableResourceType(resource),
+        name=name,
+        obj=application(proto_bytes),
+    )
+
+
+def latency_percentiles(latencies: List[float]) -> Dict[str, float]:
+    latencies = sorted(latencies)
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+    }
@@ -0,0 +1,91 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class LRUCache:
+    # `sizeof` estimates the footprint of a value, accounted against
+    # `max_bytes`. A `max_bytes` of 0 effectively disables the cache, while
+    # one of None leaves it bounded by `max_entries` alone.
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+        sizeof: Callable[[Any], int] = len,
+    ):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.sizeof = sizeof
+
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, size, expiry = entry
+                if expiry is None or expiry > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                self._pop(key)
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any):
+        size = 0 if self.max_bytes is None else self.sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            expiry = None
+            if self.ttl is not None:
+                expiry = time.monotonic() + self.ttl
+            self._entries[key] = (value, size, expiry)
+            self._bytes += size
+            while (self.max_bytes is not None and self._bytes > self.max_bytes) or (
+                self.max_entries is not None
+                and len(self._entries) > self.max_entries
+            ):
+                self._pop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, *keys: Hashable):
+        with self._lock:
+            for key in keys:
+                if key in self._entries:
+                    self._pop(key)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]):
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                self._pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def _pop(self, key: Hashable):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
@@ -0,0 +1,236 @@
+import io
+import zlib
+from typing import Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import PlainTextResponse
+
+try:
+    import zstandard
+    zstandard_error = zstandard.ZstdError
+except ImportError:
+    zstandard = None
+    zstandard_error = ValueError
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    # A compressed body is a representation of its own, so its strong ETag
+    # is the uncompressed one's suffixed with the encoding
+    if etag.endswith('"'):
+        return f'{etag[:-1]}-{encoding}"'
+    return f"{etag}-{encoding}"
+
+
+def decoded_etag(etag: str) -> str:
+    # The ETag of the uncompressed representation, with or without quotes
+    quote = '"' if etag.endswith('"') else ""
+    for encoding in ("zstd", "gzip"):
+        suffix = f"-{encoding}{quote}"
+        if etag.endswith(suffix):
+            return etag[:-len(suffix)] + quote
+    return etag
+
+
+class RequestTooLarge(Exception):
+    def __init__(self, max_size: int):
+        super().__init__(f"The request body exceeds {max_size} bytes once decompressed.")
+
+
+def _accepted_encodings(accept_encoding: Optional[str]) -> set:
+    accepted = set()
+    if accept_encoding is None:
+        return accepted
+    for coding in accept_encoding.split(","):
+        name, *params = [part.strip() for part in coding.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(name.lower())
+    return accepted
+
+
+class Compressor:
+    # Compresses with zstd where the zstandard package is installed and the
+    # client accepts it, and with gzip otherwise. Responses are left
+    # uncompressed if `minimum_size` is None, while compressed requests are
+    # still accepted, up to `max_request_size` bytes once decompressed (so
+    # that a small body cannot expand to exhaust the server's memory).
+
+    def __init__(
+        self,
+        minimum_size: Optional[int] = 1024,
+        gzip_level: int = 6,
+        zstd_level: int = 3,
+        max_request_size: Optional[int] = 64 * 1024 * 1024,
+    ):
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.zstd_level = zstd_level
+        self.max_request_size = max_request_size
+
+    @property
+    def encodings(self):
+        if zstandard is not None:
+            return ["zstd", "gzip"]
+        return ["gzip"]
+
+    def negotiate(self, accept_encoding: Optional[str], size: Optional[int] = None) -> Optional[str]:
+        # The size of a body yet to be streamed is unknown, so is not checked
+        if self.minimum_size is None:
+            return None
+        if size is not None and size < self.minimum_size:
+            return None
+        accepted = _accepted_encodings(accept_encoding)
+        for encoding in self.encodings:
+            if encoding in accepted or "*" in accepted:
+                return encoding
+        return None
+
+    def compress(self, content: bytes, encoding: str) -> bytes:
+        compressobj = self.compressobj(encoding)
+        return compressobj.compress(content) + compressobj.flush()
+
+    def compressobj(self, encoding: str):
+        if encoding == "zstd":
+            return zstandard.ZstdCompressor(level=self.zstd_level).compressobj()
+        if encoding == "gzip":
+            # wbits of 16 + 15 writes a gzip header and trailer
+            return zlib.compressobj(self.gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        raise ValueError(f"Unsupported content encoding '{encoding}'.")
+
+    def decompress(self, content: bytes, encoding: str) -> bytes:
+        # At most one byte beyond the maximum is decompressed, to tell that
+        # the maximum is exceeded.
+        max_length = -1 if self.max_request_size is None else self.max_request_size + 1
+        if encoding == "zstd" and zstandard is not None:
+            reader = zstandard.ZstdDecompressor().stream_reader(
+                io.BytesIO(content), read_across_frames=True
+            )
+            decompressed = reader.read(max_length)
+        elif encoding == "gzip":
+            decompressobj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            decompressed = decompressobj.decompress(content, max(max_length, 0))
+            if not decompressobj.eof and not decompressobj.unconsumed_tail:
+                raise zlib.error("The gzip stream is incomplete.")
+        else:
+            raise ValueError(f"Unsupported content encoding '{encoding}'.")
+        if self.max_request_size is not None and len(decompressed) > self.max_request_size:
+            raise RequestTooLarge(self.max_request_size)
+        return decompressed
+
+
+class CompressionMiddleware:
+    # Compresses response bodies of at least `minimum_size` bytes (and all
+    # streamed ones) in the encoding negotiated from Accept-Encoding, leaving
+    # responses that are already encoded as they are. Compressed request
+    # bodies are decompressed before reaching the routes.
+
+    def __init__(self, app, compressor: Compressor):
+        self.app = app
+        self.compressor = compressor
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        content_encoding = request_headers.get("content-encoding", "identity").lower()
+        if content_encoding != "identity":
+            # A body already larger than the maximum is refused unread
+            max_size = self.compressor.max_request_size
+            chunks = []
+            size = 0
+            more_body = True
+            while more_body:
+                message = await receive()
+                chunks.append(message.get("body", b""))
+                size += len(chunks[-1])
+                more_body = message.get("more_body", False)
+                if max_size is not None and size > max_size:
+                    response = PlainTextResponse(str(RequestTooLarge(max_size)), status_code=413)
+                    await response(scope, receive, send)
+                    return
+            try:
+                body = await run_in_threadpool(
+                    self.compressor.decompress, b"".join(chunks), content_encoding
+                )
+            except RequestTooLarge as err:
+                response = PlainTextResponse(str(err), status_code=413)
+                await response(scope, receive, send)
+                return
+            except (ValueError, zlib.error, zstandard_error) as err:
+                response = PlainTextResponse(str(err), status_code=415)
+                await response(scope, receive, send)
+                return
+            # Rewritten in place rather than in a copy of the scope, so that
+            # outer middleware (e.g. metrics) sees the route matched within.
+            scope["headers"] = [
+                (key, value)
+                for key, value in scope["headers"]
+                if key not in (b"content-encoding", b"content-length")
+            ] + [(b"content-length", str(len(body)).encode("latin-1"))]
+
+            async def receive_decompressed():
+                return {"type": "http.request", "body": body, "more_body": False}
+            receive = receive_decompressed
+
+        encoding = self.compressor.negotiate(request_headers.get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        compressobj = None
+
+        async def send_compressed(message):
+            nonlocal start_message, compressobj
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                if "content-encoding" in headers or message["status"] in (204, 304):
+                    await send(message)
+                else:
+                    start_message = message
+                return
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            headers = MutableHeaders(raw=start_message["headers"])
+            if compressobj is None:
+                if not more_body and len(body) < self.compressor.minimum_size:
+                    await send(start_message)
+                    start_message = None
+                    await send(message)
+                    return
+
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if "etag" in headers:
+                    headers["ETag"] = encoded_etag(headers["etag"], encoding)
+                compressobj = self.compressor.compressobj(encoding)
+                if not more_body:
+                    body = await run_in_threadpool(
+                        lambda: compressobj.compress(body) + compressobj.flush()
+                    )
+                    headers["Content-Length"] = str(len(body))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                del headers["Content-Length"]
+                await send(start_message)
+
+            body = compressobj.compress(body)
+            if not more_body:
+                body += compressobj.flush()
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
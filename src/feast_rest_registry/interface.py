@@ -1,14 +1,43 @@
 import logging
 import base64
-from datetime import datetime
+import functools
+import hashlib
+import inspect
+import itertools
+import json
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Set
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, Iterator, List, Optional, Tuple, Union, Set
 import uuid
 
 from pydantic import BaseModel
-from sqlalchemy import create_engine, delete, insert, select, update
-from sqlalchemy.engine import Engine
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Index,
+    MetaData,
+    String,
+    Table,
+    and_,
+    bindparam,
+    create_engine,
+    delete,
+    insert,
+    or_,
+    select,
+    text,
+    union,
+    update,
+)
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.util import greenlet_spawn
 
 from feast import usage
 import feast.infra.registry.sql as feast_sql_registry
@@ -33,6 +62,7 @@ from feast.protos.feast.core.FeatureService_pb2 import (
 )
 from feast.protos.feast.core.FeatureView_pb2 import FeatureView as FeatureViewProto
 from feast.protos.feast.core.InfraObject_pb2 import Infra as InfraProto
+from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
 from feast.protos.feast.core.OnDemandFeatureView_pb2 import (
     OnDemandFeatureView as OnDemandFeatureViewProto,
 )
@@ -48,9 +78,92 @@ from feast.protos.feast.core.ValidationProfile_pb2 import (
 )
 from feast.repo_config import RegistryConfig
 
+from feast_rest_registry.cache import LRUCache
+from feast_rest_registry.notify import ProjectChangeNotifier
+from feast_rest_registry.singleflight import SingleFlight
+
 
 logger = logging.getLogger("feast_rest_registry")
 
+PROTOBUF_MEDIA_TYPE = "application/x-protobuf"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# The number of rows fetched at a time when streaming a listing
+STREAM_PARTITION_SIZE = 100
+
+# The resource type of the tombstones recording a project's removal
+PROJECT_TOMBSTONE_RESOURCE = "project"
+
+# The number of names bound into each IN clause of a multi-get
+GET_MANY_CHUNK_SIZE = 500
+
+# The number of projects whose last-updated version is cached
+PROJECT_METADATA_CACHE_ENTRIES = 10000
+
+# The number of recently writing clients remembered for read-your-writes
+RECENT_WRITER_CACHE_ENTRIES = 10000
+
+# The seconds for which deletions are logged for incremental synchronisation
+DELETION_LOG_RETENTION_SECONDS = 7 * 24 * 60 * 60
+
+# The client on whose behalf the registry is called, set by the server, so
+# that a client's reads can follow its writes to the primary
+current_client: ContextVar[Optional[str]] = ContextVar(
+    "feast_rest_registry_client", default=None
+)
+
+metadata = MetaData()
+
+deletion_log = Table(
+    "deletion_log",
+    metadata,
+    Column("project_id", String(50), primary_key=True),
+    Column("resource", String(50), primary_key=True),
+    Column("name", String(50), primary_key=True),
+    Column("deleted_timestamp", BigInteger, nullable=False),
+    Index("ix_deletion_log_project_id_deleted_timestamp", "project_id", "deleted_timestamp"),
+)
+
+RESOURCE_TABLES = [
+    feast_sql_registry.entities,
+    feast_sql_registry.data_sources,
+    feast_sql_registry.feature_views,
+    feast_sql_registry.request_feature_views,
+    feast_sql_registry.stream_feature_views,
+    feast_sql_registry.on_demand_feature_views,
+    feast_sql_registry.feature_services,
+    feast_sql_registry.saved_datasets,
+    feast_sql_registry.validation_references,
+    feast_sql_registry.managed_infra,
+]
+
+
+def _registry_indexes() -> List[Index]:
+    # Feast keys its tables by (name, project_id), which leaves the per-project
+    # listings and the incremental sync's timestamp ranges to scan whole
+    # tables. feast_metadata is keyed by (project_id, metadata_key) and needs
+    # no more. The indexes are defined on copies of Feast's tables, in a
+    # MetaData of their own, as indexes defined on Feast's tables would be
+    # created by anyone else's create_all of Feast's metadata too.
+    index_metadata = MetaData()
+    indexes = []
+    for feast_table in RESOURCE_TABLES:
+        table = feast_table.to_metadata(index_metadata)
+        id_column = table.primary_key.columns[0]
+        indexes += [
+            Index(
+                f"ix_{table.name}_project_id_{id_column.name}",
+                table.c.project_id,
+                id_column,
+            ),
+            Index(
+                f"ix_{table.name}_project_id_last_updated_timestamp",
+                table.c.project_id,
+                table.c.last_updated_timestamp,
+            ),
+        ]
+    return indexes + list(deletion_log.indexes)
+
 
 class ManagedInfraNotFound(FeastObjectNotFoundException):
     def __init__(self, name: str, project: str):
@@ -59,6 +172,19 @@ class ManagedInfraNotFound(FeastObjectNotFoundException):
         )
 
 
+class ProjectNotFound(FeastObjectNotFoundException):
+    def __init__(self, project: str):
+        super().__init__(f"Project {project} does not exist")
+
+
+class ChangesNotRetained(Exception):
+    def __init__(self, project: str):
+        super().__init__(
+            f"The deletions from project {project} are not retained that far back, "
+            "so it needs to be synchronised from a snapshot"
+        )
+
+
 class PostableResourceType(str, Enum):
     entity = "entity"
     data_source = "data_source"
@@ -113,6 +239,12 @@ class FeatureViewResourceType(str, Enum):
     request_feature_view = "request_feature_view"
 
 
+class ApplicationStatus(str, Enum):
+    created = "created"
+    updated = "updated"
+    unchanged = "unchanged"
+
+
 def _infer_resource_table(resource: str):
     if resource == "entity":
         return feast_sql_registry.entities
@@ -200,11 +332,270 @@ def _infer_resource_proto_class(resource):
     raise ValueError(f"No known Proto for resource '{resource}'.")
 
 
+def _protos_size(value: Union[bytes, Dict[str, bytes]]) -> int:
+    if isinstance(value, dict):
+        return sum(len(k) + len(v) for k, v in value.items())
+    return len(value)
+
+
+def _objects_size(value: "ReturnObjects") -> int:
+    return sum(len(obj.name) + len(obj.protostring) for obj in value.objects)
+
+
+def _infer_feature_view_references(
+    resource: str, proto_bytes: bytes
+) -> Tuple[List[str], List[str], List[str]]:
+    # The names of the feature views, entities and data sources that a
+    # feature view of any flavour depends on.
+    feature_view_names = []
+    entity_names = []
+    data_sources = []
+    if resource in ("feature_view", "stream_feature_view"):
+        spec = _infer_resource_proto_class(resource).FromString(proto_bytes).spec
+        entity_names.extend(spec.entities)
+        if spec.HasField("batch_source"):
+            data_sources.append(spec.batch_source)
+        if spec.HasField("stream_source"):
+            data_sources.append(spec.stream_source)
+    elif resource == "on_demand_feature_view":
+        spec = OnDemandFeatureViewProto.FromString(proto_bytes).spec
+        for source in spec.sources.values():
+            if source.HasField("feature_view"):
+                feature_view_names.append(source.feature_view.spec.name)
+            if source.HasField("feature_view_projection"):
+                feature_view_names.append(source.feature_view_projection.feature_view_name)
+            if source.HasField("request_data_source"):
+                data_sources.append(source.request_data_source)
+    elif resource == "request_feature_view":
+        spec = RequestFeatureViewProto.FromString(proto_bytes).spec
+        if spec.HasField("request_data_source"):
+            data_sources.append(spec.request_data_source)
+    else:
+        raise ValueError(f"Resource '{resource}' is not a feature view.")
+
+    return (
+        feature_view_names,
+        entity_names,
+        [data_source.name for data_source in data_sources if data_source.name],
+    )
+
+
+def _infer_registry_field(resource: str):
+    if resource == "entity":
+        return "entities"
+    if resource in {
+        "data_source",
+        "feature_view",
+        "request_feature_view",
+        "stream_feature_view",
+        "on_demand_feature_view",
+        "feature_service",
+        "saved_dataset",
+        "validation_reference",
+    }:
+        return f"{resource}s"
+    raise ValueError(f"No known Registry field for resource '{resource}'.")
+
+
+def _encode_varint(value: int) -> bytes:
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _encode_message_field(field_number: int, message_bytes: bytes) -> bytes:
+    # The wire format of a length-delimited (message) field, which allows
+    # already-serialized protos to be embedded without parsing them.
+    return (
+        _encode_varint((field_number << 3) | 2)
+        + _encode_varint(len(message_bytes))
+        + message_bytes
+    )
+
+
+def _stamp_created_timestamp(resource: str, proto_bytes: bytes, created: datetime) -> bytes:
+    proto_class = _infer_resource_proto_class(resource)
+    obj_proto = proto_class.FromString(proto_bytes)
+
+    if hasattr(obj_proto, "meta") and hasattr(
+        obj_proto.meta, "created_timestamp"
+    ):
+        obj_proto.meta.created_timestamp.FromDatetime(created)
+
+    return obj_proto.SerializeToString()
+
+
+def _proto_digest(resource: str, proto_bytes: bytes) -> str:
+    # Clients restamp the meta timestamps on every apply, so they are left
+    # out of the comparison of stored and applied objects.
+    proto_class = _infer_resource_proto_class(resource)
+    obj_proto = proto_class.FromString(proto_bytes)
+
+    if hasattr(obj_proto, "meta"):
+        for timestamp_field in ("created_timestamp", "last_updated_timestamp"):
+            if hasattr(obj_proto.meta, timestamp_field):
+                obj_proto.meta.ClearField(timestamp_field)
+
+    return hashlib.sha256(obj_proto.SerializeToString(deterministic=True)).hexdigest()
+
+
+def _upsert(
+    conn: Connection,
+    table: Table,
+    values: Union[Dict[str, Any], List[Dict[str, Any]]],
+    update_values: Optional[Dict[str, Any]] = None,
+):
+    # Insert the rows, updating those whose primary key already exists with
+    # `update_values` (by default the non-key values being inserted).
+    rows = values if isinstance(values, list) else [values]
+    key_columns = [column.name for column in table.primary_key.columns]
+    dialect_name = conn.dialect.name
+
+    if dialect_name in ("postgresql", "sqlite"):
+        dialect_insert = postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+        stmt = dialect_insert(table)
+        if update_values is None:
+            update_values = {
+                key: stmt.excluded[key] for key in rows[0] if key not in key_columns
+            }
+        conn.execute(
+            stmt.on_conflict_do_update(index_elements=key_columns, set_=update_values),
+            rows,
+        )
+    elif dialect_name == "mysql":
+        stmt = mysql.insert(table)
+        if update_values is None:
+            update_values = {
+                key: stmt.inserted[key] for key in rows[0] if key not in key_columns
+            }
+        conn.execute(stmt.on_duplicate_key_update(update_values), rows)
+    else:
+        for row in rows:
+            update_stmt = (
+                update(table)
+                .where(*[table.c[key] == row[key] for key in key_columns])
+                .values(
+                    update_values
+                    if update_values is not None
+                    else {key: value for key, value in row.items() if key not in key_columns}
+                )
+            )
+            if conn.execute(update_stmt).rowcount == 0:
+                conn.execute(insert(table).values(row))
+
+
+def _encode_length_delimited(name: str, proto_bytes: bytes) -> bytes:
+    # Each name and proto of a listing is written as a varint length prefix
+    # followed by its bytes.
+    name_bytes = name.encode("utf-8")
+    return b"".join([
+        _encode_varint(len(name_bytes)),
+        name_bytes,
+        _encode_varint(len(proto_bytes)),
+        proto_bytes,
+    ])
+
+
+def _encode_ndjson_line(name: str, proto_bytes: bytes) -> bytes:
+    protostring = base64.b64encode(proto_bytes).decode("ascii")
+    return (json.dumps({"name": name, "protostring": protostring}) + "\n").encode("utf-8")
+
+
+def _utc_timestamp(value: datetime) -> int:
+    # Naive datetimes are in UTC, as from utcnow(), rather than local time
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def _new_project_version(update_time: int) -> str:
+    # The last-updated timestamp has a resolution of seconds, so a random
+    # suffix keeps the version unique across writes within the same second.
+    return f"{update_time}-{uuid.uuid4().hex[:8]}"
+
+
+def _encode_resource_cursor(resource: "ReturnResource") -> str:
+    return base64.urlsafe_b64encode(
+        json.dumps([resource.type, resource.name, resource.project]).encode("utf-8")
+    ).decode("ascii")
+
+
+def _decode_resource_cursor(cursor: str) -> Tuple[QueryableResourceType, str, str]:
+    try:
+        resource, name, project = json.loads(base64.urlsafe_b64decode(cursor))
+        return QueryableResourceType(resource), name, project
+    except (TypeError, ValueError) as err:
+        raise ValueError(f"Invalid resource cursor '{cursor}'.") from err
+
+
+def _parse_project_version_time(version: Optional[str]) -> Optional[int]:
+    if version is None:
+        return None
+    try:
+        return int(version.split("-")[0])
+    except ValueError:
+        return None
+
+
+def _single_flight_key(method: Callable, *args, **kwargs) -> Hashable:
+    # The method's name and its arguments by name, so that positional and
+    # keyword calls share a key
+    bound = inspect.signature(method).bind(*args, **kwargs)
+    bound.apply_defaults()
+    return (method.__name__, tuple(bound.arguments.items()))
+
+
+def _single_flight_project_matches(project: str) -> Callable[[Hashable], bool]:
+    # Calls without a project argument (e.g. listing all projects) match any
+    return lambda key: dict(key[1]).get("project", project) == project
+
+
+def _coalesced(method):
+    # Concurrent calls with equal arguments share one execution, except for
+    # clients reading their writes from the primary
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.coalesce_reads or self._pinned_to_primary():
+            return method(self, *args, **kwargs)
+        return self.single_flight.do(
+            _single_flight_key(method.__get__(self), *args, **kwargs),
+            method,
+            self,
+            *args,
+            **kwargs,
+        )
+    return wrapper
+
+
 class ApplicationObject(BaseModel):
     proto: str
     last_updated_timestamp: Union[str, datetime]
 
 
+class BatchApplicationObject(BaseModel):
+    resource: PostableResourceType
+    name: str
+    obj: ApplicationObject
+
+
+class ReturnApplication(BaseModel):
+    status: ApplicationStatus
+
+
+class ObjectReference(BaseModel):
+    resource: GettableResourceType
+    name: str
+
+
+class ReturnBatchApplication(BaseModel):
+    inserted: int
+    updated: int
+    unchanged: int = 0
+
+
 class ReturnDeletionCount(BaseModel):
     count: int
 
@@ -230,12 +621,45 @@ class ReturnResource(BaseModel):
 
 class ReturnResourceList(BaseModel):
     resources: List[ReturnResource]
+    next_cursor: Optional[str] = None
 
 
 class ReturnDatetime(BaseModel):
     datetime: Union[str, datetime]
 
 
+class ReturnNamedObject(BaseModel):
+    name: str
+    type: str
+    protostring: str
+
+
+class ReturnObjects(BaseModel):
+    objects: List[ReturnNamedObject]
+    missing: List[ReturnResource]
+
+
+class ReturnChanges(BaseModel):
+    objects: List[ReturnNamedObject]
+    deletions: List[ReturnResource]
+    last_updated: Optional[Union[str, datetime]]
+
+
+class ReturnWatch(BaseModel):
+    version: Optional[str]
+    changed: bool
+    updated: List[ReturnResource]
+    deleted: List[ReturnResource]
+
+
+class ReturnCacheStats(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+
 class ServedSqlRegistry(ABC):
     def __init__(
         self,
@@ -244,31 +668,223 @@ class ServedSqlRegistry(ABC):
             Union[RegistryConfig, feast_sql_registry.SqlRegistryConfig]
         ] = None,
         repo_path: Optional[Path] = None,
+        cache_max_bytes: int = 64 * 1024 * 1024,
+        cache_max_entries: Optional[int] = None,
+        cache_ttl: Optional[float] = 60.0,
+        engine: Optional[Engine] = None,
+        engine_options: Optional[Dict[str, Any]] = None,
+        project_metadata_ttl: Optional[float] = 1.0,
+        coalesce_reads: bool = True,
+        read_replica_paths: Optional[List[str]] = None,
+        read_engines: Optional[List[Engine]] = None,
+        read_your_writes_seconds: Optional[float] = None,
+        deletion_log_retention: Optional[float] = DELETION_LOG_RETENTION_SECONDS,
     ):
-        if registry_config is not None:
-            engine_path = registry_config.path
+        if engine is None:
+            if registry_config is not None:
+                engine_path = registry_config.path
 
-        assert engine_path, "No SQLAlchemy engine path provided."
+            assert engine_path, "No SQLAlchemy engine path provided."
+
+            engine = create_engine(engine_path, echo=False, **(engine_options or {}))
 
-        self.engine: Engine = create_engine(engine_path, echo=False)
-        feast_sql_registry.metadata.create_all(self.engine)
+        self.engine: Engine = engine
+        # The tables of an async engine are created by its AsyncServedSqlRegistry
+        if not self.engine.dialect.is_async:
+            self._create_tables()
+
+        if read_engines is None:
+            read_engines = [
+                create_engine(path, echo=False, **(engine_options or {}))
+                for path in read_replica_paths or []
+            ]
+        # Reads outside of a write are spread across the replicas in turn,
+        # while writes stay on the primary
+        self.read_engines: List[Engine] = read_engines
+        self._read_engine_turns = itertools.count()
+        # A client that wrote within `read_your_writes_seconds` reads from the
+        # primary, so as not to miss its own writes on a lagging replica.
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.recent_writers = LRUCache(
+            max_entries=RECENT_WRITER_CACHE_ENTRIES,
+            ttl=read_your_writes_seconds,
+        )
+
+        # (project, resource, name) -> (project version, proto bytes), name
+        # None for listings. Entries are only served while their version is
+        # the project's current one, so that other workers' writes are seen.
+        self.object_cache = LRUCache(
+            max_bytes=cache_max_bytes,
+            max_entries=cache_max_entries,
+            ttl=cache_ttl,
+            sizeof=lambda entry: _protos_size(entry[1]),
+        )
+        self.change_notifier = ProjectChangeNotifier()
+
+        # A project's version is written by other workers too, so is only
+        # trusted for `project_metadata_ttl`. Its UUID is replaced by a purge
+        # or teardown (by any worker), so is held as (version, UUID) and only
+        # trusted while that version is current.
+        self.project_uuids = LRUCache(max_entries=PROJECT_METADATA_CACHE_ENTRIES)
+        self.project_versions = LRUCache(
+            max_entries=PROJECT_METADATA_CACHE_ENTRIES,
+            ttl=project_metadata_ttl,
+        )
+        # (project, feature service name) -> (project version, ReturnObjects)
+        self.closure_cache = LRUCache(
+            max_bytes=cache_max_bytes,
+            max_entries=cache_max_entries,
+            sizeof=lambda entry: _objects_size(entry[1]),
+        )
+        # (project, endpoint, project version, media type) -> encoded response
+        # body, filled by the server and dropped whenever the version moves
+        self.response_cache = LRUCache(
+            max_bytes=cache_max_bytes,
+            max_entries=cache_max_entries,
+        )
+        # Deletions older than this are pruned from the log (None keeps them),
+        # so changes since before then can no longer be listed.
+        self.deletion_log_retention = deletion_log_retention
+
+        # Identical reads in flight at once share a single query, most of all
+        # when many clients start together and list the same project.
+        self.coalesce_reads = coalesce_reads
+        self.single_flight = SingleFlight()
+
+    def _create_tables(self):
+        # Workers starting together on a fresh database race to create the
+        # tables. Each failure is then a table created meanwhile by another
+        # worker, so the rest are checked for again.
+        for tables_metadata in (feast_sql_registry.metadata, metadata):
+            attempts = len(tables_metadata.tables) + 1
+            for attempt in range(attempts):
+                try:
+                    tables_metadata.create_all(self.engine)
+                    break
+                except DBAPIError as err:
+                    if attempt == attempts - 1:
+                        raise
+                    logger.warning(f"Retrying the creation of the registry tables: {err}")
+        self._create_indexes()
+
+    def _create_indexes(self):
+        # Indexes missing from the tables are added at every startup
+        for index in _registry_indexes():
+            try:
+                with self.engine.begin() as conn:
+                    index.create(conn, checkfirst=True)
+            except DBAPIError as err:
+                # e.g. created concurrently by another worker
+                logger.warning(f"Could not create index '{index.name}': {err}")
+
+    @contextmanager
+    def _begin(self, conn: Optional[Connection] = None):
+        # Reuse the caller's connection (and so its transaction) if given
+        if conn is not None:
+            yield conn
+        else:
+            with self.engine.begin() as conn:
+                yield conn
+
+    def _pinned_to_primary(self) -> bool:
+        if not self.read_engines:
+            return False
+        client = current_client.get()
+        return client is not None and self.recent_writers.get(client) is not None
+
+    def _read_engine(self) -> Engine:
+        if not self.read_engines or self._pinned_to_primary():
+            return self.engine
+        return self.read_engines[next(self._read_engine_turns) % len(self.read_engines)]
+
+    def _record_client_write(self):
+        client = current_client.get()
+        if self.read_engines and self.read_your_writes_seconds and client is not None:
+            self.recent_writers.set(client, True)
+
+    def _on_object_changed(self, project: str, resource: str, name: str):
+        self.object_cache.invalidate(
+            (project, resource, name),
+            (project, resource, None),
+        )
+
+    def _on_project_changed(self, project: str, last_updated: Optional[Tuple[int, str]]):
+        # Only once the write has committed, as until then other connections
+        # still read the project as it was, and would cache it as the new version.
+        if last_updated is None:
+            self.project_versions.invalidate(project)
+        else:
+            self.project_versions.set(project, last_updated)
+        self.closure_cache.invalidate_where(lambda key: key[0] == project)
+        self.response_cache.invalidate_where(lambda key: key[0] == project)
+        self.single_flight.forget_where(_single_flight_project_matches(project))
+        self._record_client_write()
+        self.change_notifier.publish(project)
+
+    def _get_cache_stats(self) -> ReturnCacheStats:
+        return ReturnCacheStats(**self.object_cache.stats())
 
     def teardown(self):
-        for t in {
-            feast_sql_registry.entities,
-            feast_sql_registry.data_sources,
-            feast_sql_registry.feature_views,
-            feast_sql_registry.feature_services,
-            feast_sql_registry.on_demand_feature_views,
-            feast_sql_registry.request_feature_views,
-            feast_sql_registry.saved_datasets,
-            feast_sql_registry.validation_references,
-            feast_sql_registry.managed_infra,
-            feast_sql_registry.feast_metadata,
-        }:
-            with self.engine.connect() as conn:
-                stmt = delete(t)
-                conn.execute(stmt)
+        # All or nothing, in a single transaction
+        tables = RESOURCE_TABLES + [feast_sql_registry.feast_metadata, deletion_log]
+        with self.engine.begin() as conn:
+            stmt = select(feast_sql_registry.feast_metadata.c.project_id).distinct()
+            projects = conn.execute(stmt).scalars().all()
+
+            # PostgreSQL truncates within transactions, unlike MySQL, where
+            # TRUNCATE commits implicitly
+            if conn.dialect.name == "postgresql":
+                preparer = conn.dialect.identifier_preparer
+                conn.execute(text(
+                    f"TRUNCATE TABLE {', '.join(preparer.format_table(t) for t in tables)}"
+                ))
+            else:
+                for t in tables:
+                    conn.execute(delete(t))
+
+            deleted_time = _utc_timestamp(datetime.utcnow())
+            for project in projects:
+                self._log_deletion(
+                    project, PROJECT_TOMBSTONE_RESOURCE, project, deleted_time, conn
+                )
+        self.object_cache.clear()
+        self.project_uuids.clear()
+        self.project_versions.clear()
+        self.closure_cache.clear()
+        self.response_cache.clear()
+        self.single_flight.forget_where(lambda key: True)
+        self.change_notifier.publish_all()
+
+    def _purge_served_project(self, project: str) -> ReturnDeletionCount:
+        # Removes the project's rows from every table in one transaction,
+        # leaving only its tombstone, so that incremental synchronisation
+        # clears it as it would after a teardown.
+        with self.engine.begin() as conn:
+            count = 0
+            for table in RESOURCE_TABLES:
+                rows = conn.execute(delete(table).where(table.c.project_id == project))
+                count += rows.rowcount
+            rows = conn.execute(
+                delete(feast_sql_registry.feast_metadata).where(
+                    feast_sql_registry.feast_metadata.c.project_id == project
+                )
+            )
+            if count == 0 and rows.rowcount == 0:
+                raise ProjectNotFound(project)
+            conn.execute(delete(deletion_log).where(deletion_log.c.project_id == project))
+            self._log_deletion(
+                project,
+                PROJECT_TOMBSTONE_RESOURCE,
+                project,
+                _utc_timestamp(datetime.utcnow()),
+                conn,
+            )
+
+        self.object_cache.invalidate_where(lambda key: key[0] == project)
+        self.project_uuids.invalidate(project)
+        self._on_project_changed(project, None)
+
+        return ReturnDeletionCount(count=count)
 
     def _apply_served_object(
         self,
@@ -277,56 +893,169 @@ class ServedSqlRegistry(ABC):
         name: str,
         obj: ApplicationObject,
     ):
+        assert name, f"name needs to be provided for {obj}"
+
+        return self._apply_served_proto(
+            resource=resource,
+            project=project,
+            name=name,
+            obj_proto_bytes=base64.b64decode(obj.proto.encode("ascii")),
+            update_datetime=datetime.fromisoformat(obj.last_updated_timestamp),
+        )
+
+    def _apply_served_proto(
+        self,
+        resource: PostableResourceType,
+        project: str,
+        name: str,
+        obj_proto_bytes: bytes,
+        update_datetime: datetime,
+    ) -> ReturnApplication:
         table = _infer_resource_table(resource.value)
         id_field_name, proto_field_name = _infer_resource_fields(resource.value)
-        self._maybe_init_project_metadata(project)
 
-        assert name, f"name needs to be provided for {obj}"
+        assert name, f"name needs to be provided for the {resource.value}"
 
-        with self.engine.connect() as conn:
-            update_datetime = datetime.fromisoformat(obj.last_updated_timestamp)
-            update_time = int(update_datetime.timestamp())
-            stmt = select(table).where(
+        with self.engine.begin() as conn:
+            stmt = select(getattr(table.c, proto_field_name)).where(
                 getattr(table.c, id_field_name) == name, table.c.project_id == project
             )
-            row = conn.execute(stmt).first()
-
-            obj_proto_bytes = base64.b64decode(obj.proto.encode("ascii"))
-
-            if row:
-                values = {
-                    proto_field_name: obj_proto_bytes,
-                    "last_updated_timestamp": update_time,
-                }
-                update_stmt = (
-                    update(table)
-                    .where(getattr(table.c, id_field_name) == name)
-                    .values(
-                        values,
-                    )
-                )
-                conn.execute(update_stmt)
+            stored_proto_bytes = conn.execute(stmt).scalar()
+            if stored_proto_bytes is None:
+                status = ApplicationStatus.created
+                self._maybe_init_project_metadata(project, conn)
+            elif _proto_digest(resource.value, stored_proto_bytes) == _proto_digest(
+                resource.value, obj_proto_bytes
+            ):
+                # Leave the project's version, and so its clients' caches, untouched
+                return ReturnApplication(status=ApplicationStatus.unchanged)
             else:
-                proto_class = _infer_resource_proto_class(resource.value)
-                obj_proto = proto_class.FromString(obj_proto_bytes)
-
-                if hasattr(obj_proto, "meta") and hasattr(
-                    obj_proto.meta, "created_timestamp"
-                ):
-                    obj_proto.meta.created_timestamp.FromDatetime(update_datetime)
-
-                values = {
+                status = ApplicationStatus.updated
+
+            # The rows are stamped with the server's time, rather than the
+            # client's, so that changes are listed in the order of their writes.
+            applied_datetime = datetime.utcnow()
+            update_time = _utc_timestamp(applied_datetime)
+            # New objects are stored with their creation time, updates as given
+            # (so only new objects are parsed and re-serialized to stamp it)
+            insert_proto_bytes = obj_proto_bytes
+            if status == ApplicationStatus.created:
+                insert_proto_bytes = _stamp_created_timestamp(
+                    resource.value, obj_proto_bytes, update_datetime
+                )
+            _upsert(
+                conn,
+                table,
+                {
                     id_field_name: name,
-                    proto_field_name: obj_proto.SerializeToString(),
+                    proto_field_name: insert_proto_bytes,
                     "last_updated_timestamp": update_time,
                     "project_id": project,
-                }
-                insert_stmt = insert(table).values(
-                    values,
+                },
+                update_values={
+                    proto_field_name: obj_proto_bytes,
+                    "last_updated_timestamp": update_time,
+                },
+            )
+
+            last_updated = self._set_last_updated_metadata(applied_datetime, project, conn)
+        self._on_object_changed(project, resource.value, name)
+        self._on_project_changed(project, last_updated)
+        return ReturnApplication(status=status)
+
+    def _apply_served_objects(
+        self,
+        project: str,
+        objs: List[BatchApplicationObject],
+    ) -> ReturnBatchApplication:
+        objs_by_resource: Dict[str, Dict[str, ApplicationObject]] = defaultdict(dict)
+        for batch_obj in objs:
+            assert batch_obj.name, f"name needs to be provided for {batch_obj.obj}"
+            objs_by_resource[batch_obj.resource.value][batch_obj.name] = batch_obj.obj
+
+        if not objs_by_resource:
+            return ReturnBatchApplication(inserted=0, updated=0)
+
+        inserted = 0
+        updated = 0
+        unchanged = 0
+        changed_names: Dict[str, List[str]] = defaultdict(list)
+        last_updated = None
+        # Stamped with the server's time, as for single applications
+        applied_datetime = datetime.utcnow()
+        update_time = _utc_timestamp(applied_datetime)
+        with self.engine.begin() as conn:
+            self._maybe_init_project_metadata(project, conn)
+
+            for resource, resource_objs in objs_by_resource.items():
+                table = _infer_resource_table(resource)
+                id_field_name, proto_field_name = _infer_resource_fields(resource)
+                id_column = getattr(table.c, id_field_name)
+
+                # Selected in chunks, to stay within the database's bound
+                # parameter limit however large the batch
+                names = list(resource_objs.keys())
+                existing_digests = {}
+                for i in range(0, len(names), GET_MANY_CHUNK_SIZE):
+                    stmt = select(id_column, getattr(table.c, proto_field_name)).where(
+                        id_column.in_(names[i:i + GET_MANY_CHUNK_SIZE]),
+                        table.c.project_id == project,
+                    )
+                    for name, proto_bytes in conn.execute(stmt):
+                        existing_digests[name] = _proto_digest(resource, proto_bytes)
+
+                insert_values = []
+                update_values = []
+                for name, obj in resource_objs.items():
+                    obj_proto_bytes = base64.b64decode(obj.proto.encode("ascii"))
+                    if existing_digests.get(name) == _proto_digest(resource, obj_proto_bytes):
+                        unchanged += 1
+                        continue
+
+                    update_datetime = datetime.fromisoformat(obj.last_updated_timestamp)
+                    changed_names[resource].append(name)
+                    if name in existing_digests:
+                        update_values.append({
+                            "b_name": name,
+                            proto_field_name: obj_proto_bytes,
+                            "last_updated_timestamp": update_time,
+                        })
+                    else:
+                        insert_values.append({
+                            id_field_name: name,
+                            proto_field_name: _stamp_created_timestamp(
+                                resource, obj_proto_bytes, update_datetime
+                            ),
+                            "last_updated_timestamp": update_time,
+                            "project_id": project,
+                        })
+
+                if insert_values:
+                    # Upserted in case of a concurrent insert since the select
+                    _upsert(conn, table, insert_values)
+                if update_values:
+                    update_stmt = update(table).where(
+                        id_column == bindparam("b_name"),
+                        table.c.project_id == project,
+                    )
+                    conn.execute(update_stmt, update_values)
+                inserted += len(insert_values)
+                updated += len(update_values)
+
+            if changed_names:
+                last_updated = self._set_last_updated_metadata(
+                    applied_datetime, project, conn
                 )
-                conn.execute(insert_stmt)
 
-            self._set_last_updated_metadata(update_datetime, project)
+        for resource, names in changed_names.items():
+            for name in names:
+                self._on_object_changed(project, resource, name)
+        if last_updated is not None:
+            self._on_project_changed(project, last_updated)
+
+        return ReturnBatchApplication(
+            inserted=inserted, updated=updated, unchanged=unchanged
+        )
 
     def _delete_served_object(
         self, resource: DeletableResourceType, project: str, name: str
@@ -335,58 +1064,540 @@ class ServedSqlRegistry(ABC):
         id_field_name, proto_field_name = _infer_resource_fields(resource.value)
         not_found_exception = _infer_resource_not_found_exception(resource.value)
 
-        with self.engine.connect() as conn:
+        with self.engine.begin() as conn:
             stmt = delete(table).where(
                 getattr(table.c, id_field_name) == name, table.c.project_id == project
             )
             rows = conn.execute(stmt)
             if rows.rowcount < 1:
                 raise not_found_exception(name, project)
-            self._set_last_updated_metadata(datetime.utcnow(), project)
+            deleted_datetime = datetime.utcnow()
+            self._log_deletion(
+                project, resource.value, name, _utc_timestamp(deleted_datetime), conn
+            )
+            last_updated = self._set_last_updated_metadata(deleted_datetime, project, conn)
+        self._on_object_changed(project, resource.value, name)
+        self._on_project_changed(project, last_updated)
 
-            return ReturnDeletionCount(count=rows.rowcount)
+        return ReturnDeletionCount(count=rows.rowcount)
+
+    def _log_deletion(
+        self,
+        project: str,
+        resource: str,
+        name: str,
+        deleted_time: int,
+        conn: Optional[Connection] = None,
+    ):
+        with self._begin(conn) as conn:
+            _upsert(
+                conn,
+                deletion_log,
+                {
+                    "project_id": project,
+                    "resource": resource,
+                    "name": name,
+                    "deleted_timestamp": deleted_time,
+                },
+            )
+            if self.deletion_log_retention is not None:
+                conn.execute(delete(deletion_log).where(
+                    deletion_log.c.project_id == project,
+                    deletion_log.c.deleted_timestamp
+                    < deleted_time - int(self.deletion_log_retention),
+                ))
+
+    def _check_changes_retained(self, project: str, since_time: int):
+        # Deletions from before the retention window may have been pruned
+        if self.deletion_log_retention is None:
+            return
+        if since_time < _utc_timestamp(datetime.utcnow()) - int(self.deletion_log_retention):
+            raise ChangesNotRetained(project)
+
+    def _list_served_changes(self, project: str, since: datetime) -> ReturnChanges:
+        return self._list_served_changes_versioned(project, since)[1]
+
+    def _list_served_changes_versioned(
+        self, project: str, since: datetime
+    ) -> Tuple[Optional[str], ReturnChanges]:
+        since_time = _utc_timestamp(since)
+        self._check_changes_retained(project, since_time)
+
+        objects = []
+        with self._versioned_connection(project) as (conn, version):
+            for resource in GettableResourceType:
+                table = _infer_resource_table(resource.value)
+                id_field_name, proto_field_name = _infer_resource_fields(resource.value)
+
+                stmt = select(
+                    getattr(table.c, id_field_name),
+                    getattr(table.c, proto_field_name),
+                ).where(
+                    table.c.project_id == project,
+                    table.c.last_updated_timestamp >= since_time,
+                )
+                objects += [
+                    ReturnNamedObject(
+                        name=name,
+                        type=resource.value,
+                        protostring=base64.b64encode(proto_bytes).decode("ascii"),
+                    )
+                    for name, proto_bytes in conn.execute(stmt).all()
+                ]
+
+            stmt = select(deletion_log.c.resource, deletion_log.c.name).where(
+                deletion_log.c.project_id == project,
+                deletion_log.c.deleted_timestamp >= since_time,
+            )
+            deletions = [
+                ReturnResource(name=name, type=resource, project=project)
+                for resource, name in conn.execute(stmt).all()
+            ]
+
+            stmt = select(feast_sql_registry.feast_metadata.c.last_updated_timestamp).where(
+                feast_sql_registry.feast_metadata.c.metadata_key
+                == feast_sql_registry.FeastMetadataKeys.LAST_UPDATED_TIMESTAMP.value,
+                feast_sql_registry.feast_metadata.c.project_id == project,
+            )
+            last_updated_time = conn.execute(stmt).scalar()
+
+        return version, ReturnChanges(
+            objects=objects,
+            deletions=deletions,
+            last_updated=(
+                None if last_updated_time is None
+                else datetime.utcfromtimestamp(int(last_updated_time)).isoformat()
+            ),
+        )
+
+    def _watch_served_changes(
+        self,
+        project: str,
+        version: Optional[str],
+        current_version: Optional[str],
+    ) -> ReturnWatch:
+        if version == current_version:
+            return ReturnWatch(
+                version=current_version, changed=False, updated=[], deleted=[]
+            )
+
+        updated = []
+        deleted = []
+        since_time = _parse_project_version_time(version)
+        if since_time is not None and current_version is not None:
+            self._check_changes_retained(project, since_time)
+            with self._read_engine().connect() as conn:
+                for resource in GettableResourceType:
+                    table = _infer_resource_table(resource.value)
+                    id_field_name, _ = _infer_resource_fields(resource.value)
+
+                    stmt = select(getattr(table.c, id_field_name)).where(
+                        table.c.project_id == project,
+                        table.c.last_updated_timestamp >= since_time,
+                    )
+                    updated += [
+                        ReturnResource(name=name, type=resource.value, project=project)
+                        for name in conn.execute(stmt).scalars()
+                    ]
+
+                stmt = select(deletion_log.c.resource, deletion_log.c.name).where(
+                    deletion_log.c.project_id == project,
+                    deletion_log.c.deleted_timestamp >= since_time,
+                )
+                deleted = [
+                    ReturnResource(name=name, type=resource, project=project)
+                    for resource, name in conn.execute(stmt).all()
+                ]
+
+        return ReturnWatch(
+            version=current_version, changed=True, updated=updated, deleted=deleted
+        )
 
     def _get_served_object(
         self, resource: GettableResourceType, project: str, name: str
     ) -> ReturnObject:
+        return self._get_served_object_versioned(resource, project, name)[1]
+
+    @_coalesced
+    def _get_served_object_versioned(
+        self, resource: GettableResourceType, project: str, name: str
+    ) -> Tuple[Optional[str], ReturnObject]:
+        version, proto_bytes = self._get_served_object_bytes_versioned(
+            resource, project, name
+        )
+        return version, ReturnObject(
+            protostring=base64.b64encode(proto_bytes).decode("ascii")
+        )
+
+    def _get_served_object_bytes(
+        self, resource: GettableResourceType, project: str, name: str
+    ) -> bytes:
+        return self._get_served_object_bytes_versioned(resource, project, name)[1]
+
+    def _get_served_object_bytes_versioned(
+        self, resource: GettableResourceType, project: str, name: str
+    ) -> Tuple[Optional[str], bytes]:
         table = _infer_resource_table(resource.value)
         id_field_name, proto_field_name = _infer_resource_fields(resource.value)
         not_found_exception = _infer_resource_not_found_exception(resource.value)
 
+        cache_key = (project, resource.value, name)
+        cached = self._get_cached(self.object_cache, cache_key, project)
+        if cached is not None:
+            return cached
+
         self._maybe_init_project_metadata(project)
 
-        with self.engine.connect() as conn:
-            stmt = select(table).where(
+        with self._versioned_connection(project) as (conn, version):
+            stmt = select(getattr(table.c, proto_field_name)).where(
                 getattr(table.c, id_field_name) == name, table.c.project_id == project
             )
-            row = conn.execute(stmt).first()
-            if row:
-                return ReturnObject(
-                    protostring=base64.b64encode(row[proto_field_name]).decode("ascii")
-                )
+            proto_bytes = conn.execute(stmt).scalar()
+            if proto_bytes is not None:
+                self.object_cache.set(cache_key, (version, proto_bytes))
+                return version, proto_bytes
         raise not_found_exception(name, project)
 
+    def _get_served_objects(
+        self, project: str, refs: List[ObjectReference]
+    ) -> ReturnObjects:
+        found = self._get_served_object_bytes_many(
+            project, [(ref.resource.value, ref.name) for ref in refs]
+        )
+        objects = []
+        missing = []
+        for key in dict.fromkeys((ref.resource.value, ref.name) for ref in refs):
+            resource, name = key
+            if key in found:
+                objects.append(ReturnNamedObject(
+                    name=name,
+                    type=resource,
+                    protostring=base64.b64encode(found[key]).decode("ascii"),
+                ))
+            else:
+                missing.append(ReturnResource(name=name, type=resource, project=project))
+        return ReturnObjects(objects=objects, missing=missing)
+
+    def _get_served_feature_service_closure(
+        self, project: str, name: str
+    ) -> ReturnObjects:
+        return self._get_served_feature_service_closure_versioned(project, name)[1]
+
+    def _get_served_feature_service_closure_versioned(
+        self, project: str, name: str
+    ) -> Tuple[Optional[str], ReturnObjects]:
+        cache_key = (project, name)
+        cached = self._get_cached(self.closure_cache, cache_key, project)
+        if cached is not None:
+            return cached
+
+        self._maybe_init_project_metadata(project)
+        with self._versioned_connection(project) as (conn, version):
+            closure = self._read_served_feature_service_closure(project, name, conn, version)
+        self.closure_cache.set(cache_key, (version, closure))
+        return version, closure
+
+    def _read_served_feature_service_closure(
+        self, project: str, name: str, conn: Connection, version: Optional[str]
+    ) -> ReturnObjects:
+        # The feature service, its feature views and their entities and data
+        # sources. Feature service projections do not say which flavour of
+        # feature view they name, so each is looked up in every table.
+        found = self._read_served_object_bytes_many(
+            project, [("feature_service", name)], conn, version
+        )
+        if not found:
+            raise FeatureServiceNotFoundException(name, project)
+        missing = []
+        entity_names = []
+        data_source_names = []
+
+        feature_service_proto = FeatureServiceProto.FromString(
+            found[("feature_service", name)]
+        )
+        feature_view_names = [
+            projection.feature_view_name
+            for projection in feature_service_proto.spec.features
+        ]
+        seen_feature_view_names = set()
+        while feature_view_names:
+            pending_names = [
+                feature_view_name
+                for feature_view_name in dict.fromkeys(feature_view_names)
+                if feature_view_name not in seen_feature_view_names
+            ]
+            seen_feature_view_names.update(pending_names)
+            feature_view_names = []
+
+            feature_views = self._read_served_object_bytes_many(
+                project,
+                [
+                    (resource.value, feature_view_name)
+                    for feature_view_name in pending_names
+                    for resource in FeatureViewResourceType
+                ],
+                conn,
+                version,
+            )
+            for feature_view_name in pending_names:
+                keys = [
+                    (resource.value, feature_view_name)
+                    for resource in FeatureViewResourceType
+                    if (resource.value, feature_view_name) in feature_views
+                ]
+                if not keys:
+                    missing.append(ReturnResource(
+                        name=feature_view_name, type="feature_view", project=project
+                    ))
+                for key in keys:
+                    found[key] = feature_views[key]
+                    view_names, view_entity_names, view_data_source_names = (
+                        _infer_feature_view_references(key[0], feature_views[key])
+                    )
+                    feature_view_names.extend(view_names)
+                    entity_names.extend(view_entity_names)
+                    data_source_names.extend(view_data_source_names)
+
+        dependency_keys = [
+            ("entity", entity_name) for entity_name in dict.fromkeys(entity_names)
+        ] + [
+            ("data_source", data_source_name)
+            for data_source_name in dict.fromkeys(data_source_names)
+        ]
+        dependencies = self._read_served_object_bytes_many(
+            project, dependency_keys, conn, version
+        )
+        for key in dependency_keys:
+            if key in dependencies:
+                found[key] = dependencies[key]
+            else:
+                missing.append(ReturnResource(name=key[1], type=key[0], project=project))
+
+        return ReturnObjects(
+            objects=[
+                ReturnNamedObject(
+                    name=obj_name,
+                    type=resource,
+                    protostring=base64.b64encode(proto_bytes).decode("ascii"),
+                )
+                for (resource, obj_name), proto_bytes in found.items()
+            ],
+            missing=missing,
+        )
+
+    def _get_served_object_bytes_many(
+        self, project: str, keys: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], bytes]:
+        found: Dict[Tuple[str, str], bytes] = {}
+        uncached_keys = []
+        for resource, name in dict.fromkeys(keys):
+            cached = self._get_cached(self.object_cache, (project, resource, name), project)
+            if cached is not None:
+                found[(resource, name)] = cached[1]
+            else:
+                uncached_keys.append((resource, name))
+
+        if not uncached_keys:
+            return found
+
+        self._maybe_init_project_metadata(project)
+        with self._versioned_connection(project) as (conn, version):
+            found.update(
+                self._read_served_object_bytes_many(project, uncached_keys, conn, version)
+            )
+        return found
+
+    def _read_served_object_bytes_many(
+        self,
+        project: str,
+        keys: List[Tuple[str, str]],
+        conn: Connection,
+        version: Optional[str],
+    ) -> Dict[Tuple[str, str], bytes]:
+        # Serve what is cached at the connection's version, and select the
+        # rest with one IN query per resource table (per chunk of names).
+        found: Dict[Tuple[str, str], bytes] = {}
+        uncached_names: Dict[str, List[str]] = defaultdict(list)
+        for resource, name in dict.fromkeys(keys):
+            entry = self.object_cache.get((project, resource, name))
+            if entry is not None and entry[0] == version:
+                found[(resource, name)] = entry[1]
+            else:
+                uncached_names[resource].append(name)
+
+        for resource, names in uncached_names.items():
+            table = _infer_resource_table(resource)
+            id_field_name, proto_field_name = _infer_resource_fields(resource)
+            id_column = getattr(table.c, id_field_name)
+            for i in range(0, len(names), GET_MANY_CHUNK_SIZE):
+                stmt = select(id_column, getattr(table.c, proto_field_name)).where(
+                    id_column.in_(names[i:i + GET_MANY_CHUNK_SIZE]),
+                    table.c.project_id == project,
+                )
+                for name, proto_bytes in conn.execute(stmt):
+                    self.object_cache.set((project, resource, name), (version, proto_bytes))
+                    found[(resource, name)] = proto_bytes
+        return found
+
     def _list_served_objects(
         self, resource: QueryableResourceType, project: str
     ) -> ReturnObjectList:
+        return self._list_served_objects_versioned(resource, project)[1]
+
+    @_coalesced
+    def _list_served_objects_versioned(
+        self, resource: QueryableResourceType, project: str
+    ) -> Tuple[Optional[str], ReturnObjectList]:
+        version, protos = self._list_served_object_bytes_versioned(resource, project)
+        return version, ReturnObjectList(
+            names=list(protos.keys()),
+            protostrings=[
+                base64.b64encode(proto_bytes).decode("ascii")
+                for proto_bytes in protos.values()
+            ]
+        )
+
+    def _list_served_object_bytes(
+        self, resource: QueryableResourceType, project: str
+    ) -> Dict[str, bytes]:
+        return self._list_served_object_bytes_versioned(resource, project)[1]
+
+    def _list_served_object_bytes_versioned(
+        self, resource: QueryableResourceType, project: str
+    ) -> Tuple[Optional[str], Dict[str, bytes]]:
         table = _infer_resource_table(resource.value)
         id_field_name, proto_field_name = _infer_resource_fields(resource.value)
 
+        cache_key = (project, resource.value, None)
+        cached = self._get_cached(self.object_cache, cache_key, project)
+        if cached is not None:
+            return cached
+
         self._maybe_init_project_metadata(project)
-        with self.engine.connect() as conn:
-            stmt = select(table).where(table.c.project_id == project)
-            rows = conn.execute(stmt).all()
-            protostrings = {}
-            if rows:
-                protostrings = {
-                    row[id_field_name]: base64.b64encode(row[proto_field_name]).decode("ascii")
-                    for row in rows
-                }
-        return ReturnObjectList(
-            names=list(protostrings.keys()),
-            protostrings=list(protostrings.values())
+        with self._versioned_connection(project) as (conn, version):
+            stmt = select(
+                getattr(table.c, id_field_name),
+                getattr(table.c, proto_field_name),
+            ).where(table.c.project_id == project)
+            protos = {
+                name: proto_bytes
+                for name, proto_bytes in conn.execute(stmt).all()
+            }
+        self.object_cache.set(cache_key, (version, protos))
+        return version, protos
+
+    def _iter_served_object_bytes(
+        self, resource: QueryableResourceType, project: str
+    ) -> Iterator[Tuple[str, bytes]]:
+        items = self._iter_served_object_bytes_versioned(resource, project)
+        next(items)
+        yield from items
+
+    def _iter_served_object_bytes_versioned(
+        self, resource: QueryableResourceType, project: str
+    ) -> Iterator[Union[Optional[str], Tuple[str, bytes]]]:
+        # The project's version, ahead of the objects, for the response headers
+        cached = self._get_cached(self.object_cache, (project, resource.value, None), project)
+        if cached is not None:
+            version, protos = cached
+            yield version
+            yield from protos.items()
+            return
+
+        self._maybe_init_project_metadata(project)
+        with self._versioned_connection(project) as (conn, version):
+            yield version
+            yield from self._stream_served_object_bytes(resource, project, conn)
+
+    def _stream_served_object_bytes(
+        self, resource: QueryableResourceType, project: str, conn: Connection
+    ) -> Iterator[Tuple[str, bytes]]:
+        # Fetch rows through a server-side cursor (where the dialect supports
+        # one), so that only a partition of them is held in memory at once.
+        table = _infer_resource_table(resource.value)
+        id_field_name, proto_field_name = _infer_resource_fields(resource.value)
+
+        stmt = select(
+            getattr(table.c, id_field_name),
+            getattr(table.c, proto_field_name),
+        ).where(table.c.project_id == project)
+        result = conn.execution_options(stream_results=True).execute(stmt)
+        for partition in result.partitions(STREAM_PARTITION_SIZE):
+            yield from partition
+
+    def _get_served_snapshot(self, project: str) -> ReturnObject:
+        return self._get_served_snapshot_versioned(project)[1]
+
+    def _get_served_snapshot_versioned(
+        self, project: str
+    ) -> Tuple[Optional[str], ReturnObject]:
+        chunks = self._iter_served_snapshot_bytes_versioned(project)
+        version = next(chunks)
+        return version, ReturnObject(
+            protostring=base64.b64encode(b"".join(chunks)).decode("ascii")
         )
 
+    def _get_served_snapshot_bytes(self, project: str) -> bytes:
+        return b"".join(self._iter_served_snapshot_bytes(project))
+
+    def _iter_served_snapshot_bytes(self, project: str) -> Iterator[bytes]:
+        chunks = self._iter_served_snapshot_bytes_versioned(project)
+        next(chunks)
+        yield from chunks
+
+    def _iter_served_snapshot_bytes_versioned(
+        self, project: str
+    ) -> Iterator[Union[Optional[str], bytes]]:
+        # A Registry proto is streamed as its singular fields followed by each
+        # stored object as an encoded repeated field, which parsers merge.
+        # The project's version, read along with its metadata before the rest,
+        # comes first, for the response headers.
+        registry_proto = RegistryProto()
+        version = None
+
+        # Initialized on the primary, as a replica is read-only
+        self._maybe_init_project_metadata(project)
+        with self._read_engine().connect() as conn:
+            stmt = select(feast_sql_registry.feast_metadata).where(
+                feast_sql_registry.feast_metadata.c.project_id == project
+            )
+            for row in conn.execute(stmt).all():
+                if (
+                    row["metadata_key"]
+                    == feast_sql_registry.FeastMetadataKeys.PROJECT_UUID.value
+                ):
+                    registry_proto.project_metadata.add(
+                        project=project,
+                        project_uuid=row["metadata_value"],
+                    )
+                elif (
+                    row["metadata_key"]
+                    == feast_sql_registry.FeastMetadataKeys.LAST_UPDATED_TIMESTAMP.value
+                ):
+                    version = row["metadata_value"]
+                    registry_proto.last_updated.FromDatetime(
+                        datetime.utcfromtimestamp(int(row["last_updated_timestamp"]))
+                    )
+
+            stmt = select(feast_sql_registry.managed_infra.c.infra_proto).where(
+                feast_sql_registry.managed_infra.c.project_id == project
+            )
+            infra_proto_bytes = conn.execute(stmt).scalar()
+            if infra_proto_bytes is not None:
+                registry_proto.infra.MergeFromString(infra_proto_bytes)
+
+            yield version
+            yield registry_proto.SerializeToString()
+
+            for resource in QueryableResourceType:
+                field_number = RegistryProto.DESCRIPTOR.fields_by_name[
+                    _infer_registry_field(resource.value)
+                ].number
+                for _, proto_bytes in self._stream_served_object_bytes(
+                    resource, project, conn
+                ):
+                    yield _encode_message_field(field_number, proto_bytes)
+
     def _apply_served_user_metadata(
         self,
         resource: FeatureViewResourceType,
@@ -396,14 +1607,15 @@ class ServedSqlRegistry(ABC):
     ):
         table = _infer_resource_table(resource.value)
 
-        with self.engine.connect() as conn:
+        with self.engine.begin() as conn:
             stmt = select(table).where(
                 getattr(table.c, "feature_view_name") == name,
                 table.c.project_id == project,
             )
             row = conn.execute(stmt).first()
-            update_datetime = datetime.fromisoformat(obj.last_updated_timestamp)
-            update_time = int(update_datetime.timestamp())
+            # Stamped with the server's time, as for applications
+            update_datetime = datetime.utcnow()
+            update_time = _utc_timestamp(update_datetime)
             if row:
                 values = {
                     "user_metadata": base64.b64decode(obj.proto.encode("ascii")),
@@ -422,17 +1634,28 @@ class ServedSqlRegistry(ABC):
                 conn.execute(update_stmt)
             else:
                 raise FeatureViewNotFoundException(name, project=project)
+            last_updated = self._set_last_updated_metadata(update_datetime, project, conn)
+        self._on_object_changed(project, resource.value, name)
+        self._on_project_changed(project, last_updated)
 
     def _get_served_user_metadata(
         self, resource: FeatureViewResourceType, project: str, name: str
     ) -> ReturnObject:
+        return self._get_served_user_metadata_versioned(resource, project, name)[1]
+
+    def _get_served_user_metadata_versioned(
+        self, resource: FeatureViewResourceType, project: str, name: str
+    ) -> Tuple[Optional[str], ReturnObject]:
         table = _infer_resource_table(resource.value)
 
-        with self.engine.connect() as conn:
-            stmt = select(table).where(getattr(table.c, "feature_view_name") == name)
+        with self._versioned_connection(project) as (conn, version):
+            stmt = select(table).where(
+                getattr(table.c, "feature_view_name") == name,
+                table.c.project_id == project,
+            )
             row = conn.execute(stmt).first()
             if row:
-                return ReturnObject(
+                return version, ReturnObject(
                     protostring=base64.b64encode(row["user_metadata"]).decode("ascii")
                 )
             else:
@@ -442,8 +1665,15 @@ class ServedSqlRegistry(ABC):
         self,
         project: str,
     ) -> ReturnObjectList:
-        proj_metadata = self.list_project_metadata(project)
-        return ReturnObjectList(
+        return self._list_served_project_metadata_versioned(project)[1]
+
+    @_coalesced
+    def _list_served_project_metadata_versioned(
+        self,
+        project: str,
+    ) -> Tuple[Optional[str], ReturnObjectList]:
+        version, proj_metadata = self._list_project_metadata_versioned(project)
+        return version, ReturnObjectList(
             names=[
                 proj
                 for proj in proj_metadata.keys()
@@ -464,62 +1694,109 @@ class ServedSqlRegistry(ABC):
     def _list_served_resources(
         self,
         resource: Optional[QueryableResourceType] = None,
-        name_like: Optional[str] = None
+        name_like: Optional[str] = None,
+        project: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
     ) -> ReturnResourceList:
-        resource_types = QueryableResourceType
+        resource_types = list(QueryableResourceType)
         if resource is not None:
             resource_types = [resource]
+
+        cursor_resource, cursor_name, cursor_project = None, None, None
+        if cursor is not None:
+            cursor_resource, cursor_name, cursor_project = _decode_resource_cursor(cursor)
+            # resume from the resource type the previous page ended on
+            resource_types = [
+                resource_type
+                for resource_type in resource_types
+                if list(QueryableResourceType).index(resource_type)
+                >= list(QueryableResourceType).index(cursor_resource)
+            ]
         logger.debug(f"Querying resource_types: {[r.value for r in resource_types]}.")
 
         resources = []
-        with self.engine.connect() as conn:
+        with self._read_engine().connect() as conn:
             for resource_type in resource_types:
+                if limit is not None and len(resources) >= limit:
+                    break
+
                 table = _infer_resource_table(resource_type.value)
                 id_field_name, _ = _infer_resource_fields(resource_type.value)
+                id_column = getattr(table.c, id_field_name)
 
-                stmt = select(table)
+                # ordered by the (name, project_id) primary key
+                stmt = select(id_column, table.c.project_id).order_by(
+                    id_column, table.c.project_id
+                )
                 if name_like is not None:
+                    stmt = stmt.where(id_column.like(f"%{name_like}%"))
+                if project is not None:
+                    stmt = stmt.where(table.c.project_id == project)
+                if resource_type == cursor_resource:
                     stmt = stmt.where(
-                        getattr(table.c, id_field_name).like(f"%{name_like}%")
+                        or_(
+                            id_column > cursor_name,
+                            and_(
+                                id_column == cursor_name,
+                                table.c.project_id > cursor_project,
+                            ),
+                        )
                     )
+                if limit is not None:
+                    stmt = stmt.limit(limit - len(resources))
 
                 resources += [
                     ReturnResource(
-                        name=row[id_field_name],
+                        name=name,
                         type=resource_type,
-                        project=row["project_id"]
+                        project=project_id
                     )
-                    for row in conn.execute(stmt).all()
+                    for name, project_id in conn.execute(stmt).all()
                 ]
 
+        next_cursor = None
+        if limit is not None and len(resources) >= limit:
+            next_cursor = _encode_resource_cursor(resources[-1])
+
         return ReturnResourceList(
-            resources=resources
+            resources=resources,
+            next_cursor=next_cursor,
         )
 
+    @_coalesced
     def _get_all_projects(self, name_like: Optional[str] = None) -> Set[str]:
-        projects = set()
-        with self.engine.connect() as conn:
-            for table in {
-                feast_sql_registry.entities,
-                feast_sql_registry.data_sources,
-                feast_sql_registry.feature_views,
-                feast_sql_registry.request_feature_views,
-                feast_sql_registry.on_demand_feature_views,
-                feast_sql_registry.stream_feature_views,
-            }:
-                stmt = select(table)
-                if name_like is not None:
-                    stmt = stmt.where(
-                        getattr(table.c, "project_id").like(f"%{name_like}%")
-                    )
-                rows = conn.execute(stmt).all()
-                for row in rows:
-                    projects.add(row["project_id"])
+        stmts = []
+        for table in {
+            feast_sql_registry.entities,
+            feast_sql_registry.data_sources,
+            feast_sql_registry.feature_views,
+            feast_sql_registry.request_feature_views,
+            feast_sql_registry.on_demand_feature_views,
+            feast_sql_registry.stream_feature_views,
+        }:
+            stmt = select(table.c.project_id).distinct()
+            if name_like is not None:
+                stmt = stmt.where(table.c.project_id.like(f"%{name_like}%"))
+            stmts.append(stmt)
 
-        return projects
+        with self._read_engine().connect() as conn:
+            return set(conn.execute(union(*stmts)).scalars())
 
     def list_project_metadata(self, project: str) -> Dict[str, ProjectMetadata]:
-        with self.engine.connect() as conn:
+        return self._list_project_metadata_versioned(project)[1]
+
+    def _list_project_metadata_versioned(
+        self, project: str
+    ) -> Tuple[Optional[str], Dict[str, ProjectMetadata]]:
+        cached = self._get_cached(self.project_uuids, project, project)
+        if cached is not None:
+            version, project_uuid = cached
+            return version, {
+                project: ProjectMetadata(project_name=project, project_uuid=project_uuid)
+            }
+
+        with self._versioned_connection(project) as (conn, version):
             stmt = select(feast_sql_registry.feast_metadata).where(
                 feast_sql_registry.feast_metadata.c.project_id == project,
             )
@@ -532,64 +1809,110 @@ class ServedSqlRegistry(ABC):
                         == feast_sql_registry.FeastMetadataKeys.PROJECT_UUID.value
                     ):
                         project_metadata.project_uuid = row["metadata_value"]
+                        if version is not None:
+                            self.project_uuids.set(project, (version, row["metadata_value"]))
                         break
                     # TODO(adchia): Add other project metadata in a structured way
-                return {project: project_metadata}
-        return {}
+                return version, {project: project_metadata}
+        return version, {}
 
-    def _set_last_updated_metadata(self, last_updated: datetime, project: str):
-        with self.engine.connect() as conn:
-            stmt = select(feast_sql_registry.feast_metadata).where(
-                feast_sql_registry.feast_metadata.c.metadata_key
-                == feast_sql_registry.FeastMetadataKeys.LAST_UPDATED_TIMESTAMP.value,
-                feast_sql_registry.feast_metadata.c.project_id == project,
+    def _set_last_updated_metadata(
+        self,
+        last_updated: datetime,
+        project: str,
+        conn: Optional[Connection] = None,
+    ) -> Tuple[int, str]:
+        # The caller publishes the returned version once its transaction commits
+        with self._begin(conn) as conn:
+            update_time = _utc_timestamp(last_updated)
+            version = _new_project_version(update_time)
+            _upsert(
+                conn,
+                feast_sql_registry.feast_metadata,
+                {
+                    "metadata_key": feast_sql_registry.FeastMetadataKeys.LAST_UPDATED_TIMESTAMP.value,
+                    "metadata_value": version,
+                    "last_updated_timestamp": update_time,
+                    "project_id": project,
+                },
             )
-            row = conn.execute(stmt).first()
-
-            update_time = int(last_updated.timestamp())
-
-            values = {
-                "metadata_key": feast_sql_registry.FeastMetadataKeys.LAST_UPDATED_TIMESTAMP.value,
-                "metadata_value": f"{update_time}",
-                "last_updated_timestamp": update_time,
-                "project_id": project,
-            }
-            if row:
-                update_stmt = (
-                    update(feast_sql_registry.feast_metadata)
-                    .where(
-                        feast_sql_registry.feast_metadata.c.metadata_key
-                        == feast_sql_registry.FeastMetadataKeys.LAST_UPDATED_TIMESTAMP.value,
-                        feast_sql_registry.feast_metadata.c.project_id == project,
-                    )
-                    .values(values)
-                )
-                conn.execute(update_stmt)
-            else:
-                insert_stmt = insert(feast_sql_registry.feast_metadata).values(
-                    values,
-                )
-                conn.execute(insert_stmt)
+        return update_time, version
+
+    def _read_project_last_updated(
+        self, project: str, conn: Connection
+    ) -> Optional[Tuple[int, str]]:
+        stmt = select(
+            feast_sql_registry.feast_metadata.c.last_updated_timestamp,
+            feast_sql_registry.feast_metadata.c.metadata_value,
+        ).where(
+            feast_sql_registry.feast_metadata.c.metadata_key
+            == feast_sql_registry.FeastMetadataKeys.LAST_UPDATED_TIMESTAMP.value,
+            feast_sql_registry.feast_metadata.c.project_id == project,
+        )
+        row = conn.execute(stmt).first()
+        if not row:
+            return None
+        return int(row[0]), row[1]
+
+    def _get_project_last_updated(self, project: str) -> Optional[Tuple[int, str]]:
+        # A client reading its writes from the primary skips the cached
+        # version, which may have been read from a lagging replica (and would
+        # match what was cached from there).
+        if not self._pinned_to_primary():
+            last_updated = self.project_versions.get(project)
+            if last_updated is not None:
+                return last_updated
+
+        with self._read_engine().connect() as conn:
+            last_updated = self._read_project_last_updated(project, conn)
+        if last_updated is None:
+            return None
+        self.project_versions.set(project, last_updated)
+        return last_updated
+
+    @contextmanager
+    def _versioned_connection(self, project: str):
+        # A read connection along with the project's version, read on it
+        # before anything else. What is read afterwards is at least as new as
+        # that version (on a lagging replica too), so is cached under it.
+        with self._read_engine().connect() as conn:
+            last_updated = self._read_project_last_updated(project, conn)
+            yield conn, None if last_updated is None else last_updated[1]
+
+    def _get_cached(self, cache: LRUCache, key: Hashable, project: str) -> Optional[tuple]:
+        # A (version, value) entry, if its version is still the project's
+        entry = cache.get(key)
+        if entry is None or entry[0] != self._get_project_version(project):
+            return None
+        return entry
 
     def _get_last_updated_metadata(self, project: str):
-        with self.engine.connect() as conn:
-            stmt = select(feast_sql_registry.feast_metadata).where(
-                feast_sql_registry.feast_metadata.c.metadata_key
-                == feast_sql_registry.FeastMetadataKeys.LAST_UPDATED_TIMESTAMP.value,
-                feast_sql_registry.feast_metadata.c.project_id == project,
-            )
-            row = conn.execute(stmt).first()
-            if not row:
-                return None
-            update_time = int(row["last_updated_timestamp"])
-
-            return datetime.utcfromtimestamp(update_time)
-
-    def _maybe_init_project_metadata(self, project):
-        # Initialize project metadata if needed
-        with self.engine.connect() as conn:
-            update_datetime = datetime.utcnow()
-            update_time = int(update_datetime.timestamp())
+        last_updated = self._get_project_last_updated(project)
+        if last_updated is None:
+            return None
+        return datetime.utcfromtimestamp(last_updated[0])
+
+    def _get_project_version(self, project: str) -> Optional[str]:
+        last_updated = self._get_project_last_updated(project)
+        if last_updated is None:
+            return None
+        return last_updated[1]
+
+    def _maybe_init_project_metadata(self, project, conn: Optional[Connection] = None):
+        # Initialize project metadata if needed. Reads trust the UUIDs seen
+        # at the project's current version, while writes re-check.
+        is_read = conn is None
+        if is_read:
+            cached = self._get_cached(self.project_uuids, project, project)
+            if cached is not None:
+                usage.set_current_project_uuid(cached[1])
+                return
+
+        with self._begin(conn) as conn:
+            last_updated = None
+            if is_read:
+                last_updated = self._read_project_last_updated(project, conn)
+            update_time = _utc_timestamp(datetime.utcnow())
             stmt = select(feast_sql_registry.feast_metadata).where(
                 feast_sql_registry.feast_metadata.c.metadata_key
                 == feast_sql_registry.FeastMetadataKeys.PROJECT_UUID.value,
@@ -598,14 +1921,333 @@ class ServedSqlRegistry(ABC):
             row = conn.execute(stmt).first()
             if row:
                 usage.set_current_project_uuid(row["metadata_value"])
+                if last_updated is not None:
+                    self.project_uuids.set(project, (last_updated[1], row["metadata_value"]))
             else:
-                new_project_uuid = f"{uuid.uuid4()}"
-                values = {
-                    "metadata_key": feast_sql_registry.FeastMetadataKeys.PROJECT_UUID.value,
-                    "metadata_value": new_project_uuid,
-                    "last_updated_timestamp": update_time,
-                    "project_id": project,
-                }
-                insert_stmt = insert(feast_sql_registry.feast_metadata).values(values)
-                conn.execute(insert_stmt)
-                usage.set_current_project_uuid(new_project_uuid)
+                # A concurrent initialization keeps its UUID, so read back the winner
+                _upsert(
+                    conn,
+                    feast_sql_registry.feast_metadata,
+                    {
+                        "metadata_key": feast_sql_registry.FeastMetadataKeys.PROJECT_UUID.value,
+                        "metadata_value": f"{uuid.uuid4()}",
+                        "last_updated_timestamp": update_time,
+                        "project_id": project,
+                    },
+                    update_values={
+                        "metadata_value": feast_sql_registry.feast_metadata.c.metadata_value,
+                    },
+                )
+                usage.set_current_project_uuid(conn.execute(stmt).first()["metadata_value"])
+
+
+_END_OF_ITERATOR = object()
+
+
+async def _greenlet_iterate(iterator: Iterator) -> AsyncIterator:
+    # Advance a synchronous iterator one item per greenlet, so that a
+    # generator holding a connection can be streamed without blocking.
+    try:
+        while True:
+            item = await greenlet_spawn(next, iterator, _END_OF_ITERATOR)
+            if item is _END_OF_ITERATOR:
+                return
+            yield item
+    finally:
+        if hasattr(iterator, "close"):
+            await greenlet_spawn(iterator.close)
+
+
+class AsyncServedSqlRegistry:
+    # Serves the registry through an async SQLAlchemy engine (e.g.
+    # `postgresql+asyncpg` or `sqlite+aiosqlite`). Each method runs the
+    # synchronous ServedSqlRegistry implementation in a greenlet, as
+    # SQLAlchemy's asyncio extension does, so that its database calls are
+    # awaited on the async driver instead of blocking a thread.
+
+    def __init__(
+        self,
+        engine_path: Optional[str] = None,
+        registry_config: Optional[
+            Union[RegistryConfig, feast_sql_registry.SqlRegistryConfig]
+        ] = None,
+        repo_path: Optional[Path] = None,
+        engine_options: Optional[Dict[str, Any]] = None,
+        coalesce_reads: bool = True,
+        read_replica_paths: Optional[List[str]] = None,
+        **kwargs,
+    ):
+        if registry_config is not None:
+            engine_path = registry_config.path
+
+        assert engine_path, "No SQLAlchemy engine path provided."
+
+        self.async_engine: AsyncEngine = create_async_engine(
+            engine_path, echo=False, **(engine_options or {})
+        )
+        # Reads are coalesced here instead, as waiting on a thread's event
+        # would block the event loop running the call in flight.
+        self.async_read_engines: List[AsyncEngine] = [
+            create_async_engine(path, echo=False, **(engine_options or {}))
+            for path in read_replica_paths or []
+        ]
+        self.registry = ServedSqlRegistry(
+            engine=self.async_engine.sync_engine,
+            coalesce_reads=False,
+            read_engines=[engine.sync_engine for engine in self.async_read_engines],
+            **kwargs,
+        )
+        self.coalesce_reads = coalesce_reads
+        self.object_cache = self.registry.object_cache
+        self.change_notifier = self.registry.change_notifier
+        self.response_cache = self.registry.response_cache
+        self.single_flight = self.registry.single_flight
+
+    async def _coalesced(self, method, *args):
+        if not self.coalesce_reads or self.registry._pinned_to_primary():
+            return await greenlet_spawn(method, *args)
+        return await self.single_flight.do_async(
+            _single_flight_key(method, *args), greenlet_spawn, method, *args
+        )
+
+    async def initialize(self):
+        await greenlet_spawn(self.registry._create_tables)
+
+    def _get_cache_stats(self) -> ReturnCacheStats:
+        return self.registry._get_cache_stats()
+
+    async def teardown(self):
+        return await greenlet_spawn(self.registry.teardown)
+
+    async def _apply_served_object(
+        self,
+        resource: PostableResourceType,
+        project: str,
+        name: str,
+        obj: ApplicationObject,
+    ):
+        return await greenlet_spawn(
+            self.registry._apply_served_object, resource, project, name, obj
+        )
+
+    async def _apply_served_proto(
+        self,
+        resource: PostableResourceType,
+        project: str,
+        name: str,
+        obj_proto_bytes: bytes,
+        update_datetime: datetime,
+    ) -> ReturnApplication:
+        return await greenlet_spawn(
+            self.registry._apply_served_proto,
+            resource,
+            project,
+            name,
+            obj_proto_bytes,
+            update_datetime,
+        )
+
+    async def _apply_served_objects(
+        self,
+        project: str,
+        objs: List[BatchApplicationObject],
+    ) -> ReturnBatchApplication:
+        return await greenlet_spawn(self.registry._apply_served_objects, project, objs)
+
+    async def _delete_served_object(
+        self, resource: DeletableResourceType, project: str, name: str
+    ) -> ReturnDeletionCount:
+        return await greenlet_spawn(
+            self.registry._delete_served_object, resource, project, name
+        )
+
+    async def _purge_served_project(self, project: str) -> ReturnDeletionCount:
+        return await greenlet_spawn(self.registry._purge_served_project, project)
+
+    async def _list_served_changes(self, project: str, since: datetime) -> ReturnChanges:
+        return await greenlet_spawn(self.registry._list_served_changes, project, since)
+
+    async def _list_served_changes_versioned(
+        self, project: str, since: datetime
+    ) -> Tuple[Optional[str], ReturnChanges]:
+        return await greenlet_spawn(
+            self.registry._list_served_changes_versioned, project, since
+        )
+
+    async def _watch_served_changes(
+        self,
+        project: str,
+        version: Optional[str],
+        current_version: Optional[str],
+    ) -> ReturnWatch:
+        return await greenlet_spawn(
+            self.registry._watch_served_changes, project, version, current_version
+        )
+
+    async def _get_served_object(
+        self, resource: GettableResourceType, project: str, name: str
+    ) -> ReturnObject:
+        return (await self._get_served_object_versioned(resource, project, name))[1]
+
+    async def _get_served_object_versioned(
+        self, resource: GettableResourceType, project: str, name: str
+    ) -> Tuple[Optional[str], ReturnObject]:
+        return await self._coalesced(
+            self.registry._get_served_object_versioned, resource, project, name
+        )
+
+    async def _get_served_object_bytes(
+        self, resource: GettableResourceType, project: str, name: str
+    ) -> bytes:
+        return await greenlet_spawn(
+            self.registry._get_served_object_bytes, resource, project, name
+        )
+
+    async def _get_served_object_bytes_versioned(
+        self, resource: GettableResourceType, project: str, name: str
+    ) -> Tuple[Optional[str], bytes]:
+        return await greenlet_spawn(
+            self.registry._get_served_object_bytes_versioned, resource, project, name
+        )
+
+    async def _get_served_objects(
+        self, project: str, refs: List[ObjectReference]
+    ) -> ReturnObjects:
+        return await greenlet_spawn(self.registry._get_served_objects, project, refs)
+
+    async def _get_served_feature_service_closure(
+        self, project: str, name: str
+    ) -> ReturnObjects:
+        return await greenlet_spawn(
+            self.registry._get_served_feature_service_closure, project, name
+        )
+
+    async def _get_served_feature_service_closure_versioned(
+        self, project: str, name: str
+    ) -> Tuple[Optional[str], ReturnObjects]:
+        return await greenlet_spawn(
+            self.registry._get_served_feature_service_closure_versioned, project, name
+        )
+
+    async def _list_served_objects(
+        self, resource: QueryableResourceType, project: str
+    ) -> ReturnObjectList:
+        return (await self._list_served_objects_versioned(resource, project))[1]
+
+    async def _list_served_objects_versioned(
+        self, resource: QueryableResourceType, project: str
+    ) -> Tuple[Optional[str], ReturnObjectList]:
+        return await self._coalesced(
+            self.registry._list_served_objects_versioned, resource, project
+        )
+
+    async def _list_served_object_bytes(
+        self, resource: QueryableResourceType, project: str
+    ) -> Dict[str, bytes]:
+        return await greenlet_spawn(
+            self.registry._list_served_object_bytes, resource, project
+        )
+
+    def _iter_served_object_bytes(
+        self, resource: QueryableResourceType, project: str
+    ) -> AsyncIterator[Tuple[str, bytes]]:
+        return _greenlet_iterate(
+            self.registry._iter_served_object_bytes(resource, project)
+        )
+
+    def _iter_served_object_bytes_versioned(
+        self, resource: QueryableResourceType, project: str
+    ) -> AsyncIterator[Union[Optional[str], Tuple[str, bytes]]]:
+        return _greenlet_iterate(
+            self.registry._iter_served_object_bytes_versioned(resource, project)
+        )
+
+    async def _get_served_snapshot(self, project: str) -> ReturnObject:
+        return await greenlet_spawn(self.registry._get_served_snapshot, project)
+
+    async def _get_served_snapshot_versioned(
+        self, project: str
+    ) -> Tuple[Optional[str], ReturnObject]:
+        return await greenlet_spawn(self.registry._get_served_snapshot_versioned, project)
+
+    async def _get_served_snapshot_bytes(self, project: str) -> bytes:
+        return await greenlet_spawn(self.registry._get_served_snapshot_bytes, project)
+
+    def _iter_served_snapshot_bytes(self, project: str) -> AsyncIterator[bytes]:
+        return _greenlet_iterate(self.registry._iter_served_snapshot_bytes(project))
+
+    def _iter_served_snapshot_bytes_versioned(
+        self, project: str
+    ) -> AsyncIterator[Union[Optional[str], bytes]]:
+        return _greenlet_iterate(
+            self.registry._iter_served_snapshot_bytes_versioned(project)
+        )
+
+    async def _apply_served_user_metadata(
+        self,
+        resource: FeatureViewResourceType,
+        project: str,
+        name: str,
+        obj: ApplicationObject,
+    ):
+        return await greenlet_spawn(
+            self.registry._apply_served_user_metadata, resource, project, name, obj
+        )
+
+    async def _get_served_user_metadata(
+        self, resource: FeatureViewResourceType, project: str, name: str
+    ) -> ReturnObject:
+        return await greenlet_spawn(
+            self.registry._get_served_user_metadata, resource, project, name
+        )
+
+    async def _get_served_user_metadata_versioned(
+        self, resource: FeatureViewResourceType, project: str, name: str
+    ) -> Tuple[Optional[str], ReturnObject]:
+        return await greenlet_spawn(
+            self.registry._get_served_user_metadata_versioned, resource, project, name
+        )
+
+    async def _list_served_project_metadata(self, project: str) -> ReturnObjectList:
+        return (await self._list_served_project_metadata_versioned(project))[1]
+
+    async def _list_served_project_metadata_versioned(
+        self, project: str
+    ) -> Tuple[Optional[str], ReturnObjectList]:
+        return await self._coalesced(
+            self.registry._list_served_project_metadata_versioned, project
+        )
+
+    async def _list_served_projects(
+        self, name_like: Optional[str] = None
+    ) -> ReturnStringList:
+        return ReturnStringList(strings=await self._get_all_projects(name_like))
+
+    async def _list_served_resources(
+        self,
+        resource: Optional[QueryableResourceType] = None,
+        name_like: Optional[str] = None,
+        project: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> ReturnResourceList:
+        return await greenlet_spawn(
+            self.registry._list_served_resources,
+            resource,
+            name_like,
+            project,
+            limit,
+            cursor,
+        )
+
+    async def _get_all_projects(self, name_like: Optional[str] = None) -> Set[str]:
+        return await self._coalesced(self.registry._get_all_projects, name_like)
+
+    async def list_project_metadata(self, project: str) -> Dict[str, ProjectMetadata]:
+        return await greenlet_spawn(self.registry.list_project_metadata, project)
+
+    async def _get_last_updated_metadata(self, project: str):
+        return await greenlet_spawn(self.registry._get_last_updated_metadata, project)
+
+    async def _get_project_version(self, project: str) -> Optional[str]:
+        return await greenlet_spawn(self.registry._get_project_version, project)
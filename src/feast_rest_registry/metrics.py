@@ -0,0 +1,284 @@
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional, Sequence
+from urllib.parse import parse_qs
+
+from prometheus_client import CollectorRegistry, Counter, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from feast_rest_registry.cache import LRUCache
+from feast_rest_registry.singleflight import SingleFlight
+
+# The `resource` query parameter values recorded as labels, other values
+# being recorded as "" to bound the metrics' cardinality
+RESOURCE_LABELS = {
+    "entity",
+    "data_source",
+    "feature_view",
+    "stream_feature_view",
+    "on_demand_feature_view",
+    "request_feature_view",
+    "feature_service",
+    "saved_dataset",
+    "validation_reference",
+    "managed_infra",
+}
+
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+SIZE_BUCKETS = tuple(2 ** exponent for exponent in range(6, 27, 2))
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+
+class _RequestStats:
+    def __init__(self):
+        self.queries = 0
+        self.query_seconds = 0.0
+
+
+_request_stats: ContextVar[Optional[_RequestStats]] = ContextVar(
+    "feast_rest_registry_request_stats", default=None
+)
+
+
+class _CacheCollector:
+    def __init__(self, caches: Dict[str, LRUCache]):
+        self.caches = caches
+
+    def collect(self):
+        hits = CounterMetricFamily(
+            "feast_rest_registry_cache_hits", "Cache hits.", labels=["cache"]
+        )
+        misses = CounterMetricFamily(
+            "feast_rest_registry_cache_misses", "Cache misses.", labels=["cache"]
+        )
+        hit_ratio = GaugeMetricFamily(
+            "feast_rest_registry_cache_hit_ratio",
+            "The fraction of cache lookups that were hits.",
+            labels=["cache"],
+        )
+        entries = GaugeMetricFamily(
+            "feast_rest_registry_cache_entries", "Cached entries.", labels=["cache"]
+        )
+        size = GaugeMetricFamily(
+            "feast_rest_registry_cache_bytes",
+            "The accounted size of the cached entries.",
+            labels=["cache"],
+        )
+        for name, cache in self.caches.items():
+            stats = cache.stats()
+            lookups = stats["hits"] + stats["misses"]
+            hits.add_metric([name], stats["hits"])
+            misses.add_metric([name], stats["misses"])
+            hit_ratio.add_metric([name], stats["hits"] / lookups if lookups else 0.0)
+            entries.add_metric([name], stats["entries"])
+            size.add_metric([name], stats["bytes"])
+        return [hits, misses, hit_ratio, entries, size]
+
+
+class _SingleFlightCollector:
+    def __init__(self, single_flight: SingleFlight):
+        self.single_flight = single_flight
+
+    def collect(self):
+        calls = CounterMetricFamily(
+            "feast_rest_registry_coalescable_calls",
+            "Coalescable registry reads that ran, rather than sharing one in flight.",
+            labels=["method"],
+        )
+        coalesced = CounterMetricFamily(
+            "feast_rest_registry_coalesced_calls",
+            "Registry reads that shared the result of an identical one in flight.",
+            labels=["method"],
+        )
+        stats = self.single_flight.stats()
+        for method, count in stats["calls"].items():
+            calls.add_metric([method], count)
+        for method, count in stats["coalesced"].items():
+            coalesced.add_metric([method], count)
+        return [calls, coalesced]
+
+
+class _PoolCollector:
+    def __init__(self, engine: Engine):
+        self.engine = engine
+
+    def collect(self):
+        checked_out = GaugeMetricFamily(
+            "feast_rest_registry_db_pool_checked_out",
+            "The connections currently checked out of the pool.",
+        )
+        overflow = GaugeMetricFamily(
+            "feast_rest_registry_db_pool_overflow",
+            "The connections open beyond the pool size.",
+        )
+        pool = self.engine.pool
+        # Only queue pools keep these counts
+        if hasattr(pool, "checkedout"):
+            checked_out.add_metric([], pool.checkedout())
+        if hasattr(pool, "overflow"):
+            overflow.add_metric([], max(pool.overflow(), 0))
+        return [checked_out, overflow]
+
+
+class RegistryMetrics:
+    # Each app records into its own CollectorRegistry, so that several
+    # apps can live in one process.
+
+    def __init__(
+        self,
+        engine: Engine,
+        caches: Dict[str, LRUCache],
+        single_flight: Optional[SingleFlight] = None,
+        read_engines: Sequence[Engine] = (),
+    ):
+        self.registry = CollectorRegistry()
+        self.requests = Counter(
+            "feast_rest_registry_requests",
+            "Requests served.",
+            ["method", "route", "resource", "status"],
+            registry=self.registry,
+        )
+        self.request_seconds = Histogram(
+            "feast_rest_registry_request_duration_seconds",
+            "The time to serve a request, up to its last response byte.",
+            ["method", "route", "resource"],
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.response_bytes = Histogram(
+            "feast_rest_registry_response_bytes",
+            "The size of response bodies.",
+            ["method", "route", "resource"],
+            buckets=SIZE_BUCKETS,
+            registry=self.registry,
+        )
+        self.request_queries = Histogram(
+            "feast_rest_registry_request_db_queries",
+            "The database queries made by a request.",
+            ["method", "route"],
+            buckets=COUNT_BUCKETS,
+            registry=self.registry,
+        )
+        self.request_query_seconds = Histogram(
+            "feast_rest_registry_request_db_query_seconds",
+            "The time a request spent in database queries.",
+            ["method", "route"],
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.query_seconds = Histogram(
+            "feast_rest_registry_db_query_duration_seconds",
+            "The duration of database queries.",
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.pool_checkouts = Counter(
+            "feast_rest_registry_db_pool_checkouts",
+            "Connections checked out of the pool.",
+            registry=self.registry,
+        )
+        self.pool_wait_seconds = Histogram(
+            "feast_rest_registry_db_pool_wait_seconds",
+            "The time taken to obtain a connection, waiting on the pool or connecting.",
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.registry.register(_CacheCollector(caches))
+        self.registry.register(_PoolCollector(engine))
+        if single_flight is not None:
+            self.registry.register(_SingleFlightCollector(single_flight))
+        self._instrument_engine(engine)
+        for read_engine in read_engines:
+            self._instrument_engine(read_engine)
+
+    def _instrument_engine(self, engine: Engine):
+        @event.listens_for(engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            elapsed = time.perf_counter() - conn.info["query_start_times"].pop()
+            self.query_seconds.observe(elapsed)
+            stats = _request_stats.get()
+            if stats is not None:
+                stats.queries += 1
+                stats.query_seconds += elapsed
+
+        @event.listens_for(engine.pool, "checkout")
+        def checkout(dbapi_connection, connection_record, connection_proxy):
+            self.pool_checkouts.inc()
+
+        # The pool has no event for the start of a checkout, so time the
+        # engine's acquisition of a connection.
+        raw_connection = engine.raw_connection
+
+        def timed_raw_connection(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return raw_connection(*args, **kwargs)
+            finally:
+                self.pool_wait_seconds.observe(time.perf_counter() - start)
+
+        engine.raw_connection = timed_raw_connection
+
+    def render(self) -> bytes:
+        return generate_latest(self.registry)
+
+
+class MetricsMiddleware:
+    # A pure ASGI middleware, so that the bytes and queries of streamed
+    # responses are counted up to the end of their bodies.
+
+    def __init__(self, app, metrics: RegistryMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        stats = _RequestStats()
+        token = _request_stats.set(stats)
+        response = {"status": 500, "bytes": 0}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                response["bytes"] += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_stats.reset(token)
+            self._observe(scope, response, stats, time.perf_counter() - start)
+
+    def _observe(self, scope, response, stats: _RequestStats, elapsed: float):
+        route = scope.get("route")
+        route_path = getattr(route, "path", "unmatched")
+        resource = parse_qs(scope.get("query_string", b"").decode("latin-1")).get(
+            "resource", [""]
+        )[0]
+        if resource not in RESOURCE_LABELS:
+            resource = ""
+
+        method = scope["method"]
+        self.metrics.requests.labels(
+            method, route_path, resource, str(response["status"])
+        ).inc()
+        self.metrics.request_seconds.labels(method, route_path, resource).observe(elapsed)
+        self.metrics.response_bytes.labels(method, route_path, resource).observe(
+            response["bytes"]
+        )
+        self.metrics.request_queries.labels(method, route_path).observe(stats.queries)
+        self.metrics.request_query_seconds.labels(method, route_path).observe(
+            stats.query_seconds
+        )
@@ -0,0 +1,45 @@
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Dict, Set, Tuple
+
+
+class ProjectChangeNotifier:
+    # Wakes the coroutines waiting on a project, from whichever thread
+    # wrote to it. Writes by other processes are not seen here, so waiters
+    # are expected to also poll the database.
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waiters: Dict[
+            str, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]
+        ] = defaultdict(set)
+
+    def publish(self, project: str):
+        with self._lock:
+            waiters = self._waiters.pop(project, set())
+        for loop, event in waiters:
+            loop.call_soon_threadsafe(event.set)
+
+    def publish_all(self):
+        with self._lock:
+            projects = list(self._waiters.keys())
+        for project in projects:
+            self.publish(project)
+
+    async def wait(self, project: str, timeout: float) -> bool:
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._waiters[project].add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                project_waiters = self._waiters.get(project)
+                if project_waiters is not None:
+                    project_waiters.discard(waiter)
+                    if not project_waiters:
+                        del self._waiters[project]
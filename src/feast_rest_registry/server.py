@@ -1,48 +1,460 @@
 import logging
 import traceback
 import argparse
-from typing import Optional
+import asyncio
+import base64
+import json
+import os
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-from fastapi import FastAPI, HTTPException, Response, status
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from prometheus_client import CONTENT_TYPE_LATEST
+from pydantic import ValidationError
+from sqlalchemy.engine import make_url
 
-from feast_rest_registry import interface
+from feast_rest_registry import compression, interface, metrics
 from feast.errors import FeastObjectNotFoundException
 
 import uvicorn
 
+JSON_MEDIA_TYPE = "application/json"
+
+# The JSON encoded keyword arguments of get_app, read by create_app in each worker
+APP_OPTIONS_ENV_VAR = "FEAST_REST_REGISTRY_APP_OPTIONS"
+
+# Identifies a client across connections (e.g. by its pod name) to read its own
+# writes, a client without it being identified by its address
+CLIENT_ID_HEADER = "X-Client-Id"
+
+
+# Each representation of a version has its own strong ETag: the version
+# suffixed with its media type (JSON's bare) and, if compressed, its encoding.
+ETAG_MEDIA_TYPE_SUFFIXES = {
+    interface.PROTOBUF_MEDIA_TYPE: "-pb",
+    interface.NDJSON_MEDIA_TYPE: "-ndjson",
+}
+
+
+def _etag(version: str, media_type: str = JSON_MEDIA_TYPE) -> str:
+    return f'"{version}{ETAG_MEDIA_TYPE_SUFFIXES.get(media_type, "")}"'
+
+
+def _etag_version(etag: str) -> str:
+    # The version of any representation's ETag, given with or without quotes
+    if etag.startswith("W/"):
+        etag = etag[2:]
+    version = compression.decoded_etag(etag.strip('"'))
+    for suffix in ETAG_MEDIA_TYPE_SUFFIXES.values():
+        if version.endswith(suffix):
+            return version[:-len(suffix)]
+    return version
+
+
+def _set_etag(response: Response, version: Optional[str], media_type: str = JSON_MEDIA_TYPE):
+    if version is not None:
+        response.headers["ETag"] = _etag(version, media_type)
+        response.headers["Vary"] = "Accept"
+
+
+def _matching_etag(etag: str, if_none_match: Optional[str]) -> Optional[str]:
+    # The given tag of the representation, in whichever content encoding
+    if if_none_match is None:
+        return None
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == "*":
+            return etag
+        if compression.decoded_etag(tag) == etag:
+            return tag
+    return None
+
+
+def _accepts(accept: Optional[str], media_type: str) -> bool:
+    if accept is None:
+        return False
+    return any(
+        media_range.split(";")[0].strip() == media_type
+        for media_range in accept.split(",")
+    )
+
+
+def _bytes_response(content: bytes, media_type: str, response: Response) -> Response:
+    headers = {"Vary": "Accept"}
+    if "ETag" in response.headers:
+        headers["ETag"] = response.headers["ETag"]
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers=headers,
+    )
+
+
+def _tee_chunks(
+    chunks: Union[Iterator[bytes], AsyncIterator[bytes]],
+    on_complete: Callable[[bytes], None],
+    max_bytes: int,
+) -> Union[Iterator[bytes], AsyncIterator[bytes]]:
+    # Pass the chunks through, handing over their concatenation once all
+    # have been sent. Chunks stop being kept once they add up to more than
+    # `max_bytes`, so that streams too large to cache use constant memory.
+    parts: Optional[List[bytes]] = []
+    size = 0
+
+    def keep(chunk: bytes):
+        nonlocal parts, size
+        if parts is None:
+            return
+        size += len(chunk)
+        if size > max_bytes:
+            parts = None
+        else:
+            parts.append(chunk)
+
+    if hasattr(chunks, "__aiter__"):
+        async def tee_async():
+            async for chunk in chunks:
+                keep(chunk)
+                yield chunk
+            if parts is not None:
+                on_complete(b"".join(parts))
+        return tee_async()
+
+    def tee():
+        for chunk in chunks:
+            keep(chunk)
+            yield chunk
+        if parts is not None:
+            on_complete(b"".join(parts))
+    return tee()
+
+
+async def _split_version(
+    items: Union[Iterator, AsyncIterator],
+) -> Tuple[Optional[str], Union[Iterator, AsyncIterator]]:
+    # The registry's versioned iterators yield the project's version ahead of
+    # their items, as the ETag is sent before any of them.
+    if hasattr(items, "__aiter__"):
+        return await items.__anext__(), items
+    return await run_in_threadpool(next, items), items
+
+
+async def _call(method, *args, **kwargs):
+    # Await the async registry's coroutines, running the sync registry's
+    # blocking methods in the threadpool.
+    if asyncio.iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+    return await run_in_threadpool(method, *args, **kwargs)
+
+
+def _map_items(
+    encode: Callable[[str, bytes], bytes],
+    items: Union[Iterator[Tuple[str, bytes]], AsyncIterator[Tuple[str, bytes]]],
+) -> Union[Iterator[bytes], AsyncIterator[bytes]]:
+    if hasattr(items, "__aiter__"):
+        async def encode_async():
+            async for name, proto_bytes in items:
+                yield encode(name, proto_bytes)
+        return encode_async()
+    return (encode(name, proto_bytes) for name, proto_bytes in items)
+
+
+def _streaming_response(
+    content: Union[Iterator[bytes], AsyncIterator[bytes]],
+    media_type: str,
+    response: Response
+) -> StreamingResponse:
+    headers = {"Vary": "Accept"}
+    if "ETag" in response.headers:
+        headers["ETag"] = response.headers["ETag"]
+    return StreamingResponse(
+        content=content,
+        media_type=media_type,
+        headers=headers,
+    )
+
+
+async def _identify_client(request: Request):
+    client = request.headers.get(CLIENT_ID_HEADER)
+    if client is None and request.client is not None:
+        client = request.client.host
+    interface.current_client.set(client)
+
+
+async def _read_application(
+    request: Request,
+    last_updated_timestamp: Optional[str] = None,
+) -> Tuple[bytes, datetime]:
+    # Applications are either a JSON ApplicationObject holding a base64
+    # protostring, or the raw proto with its timestamp as a query parameter.
+    body = await request.body()
+    content_type = request.headers.get("content-type", "")
+    try:
+        if content_type.split(";")[0].strip() == interface.PROTOBUF_MEDIA_TYPE:
+            if last_updated_timestamp is None:
+                return body, datetime.utcnow()
+            return body, datetime.fromisoformat(last_updated_timestamp)
+
+        obj = interface.ApplicationObject(**json.loads(body))
+        return (
+            base64.b64decode(obj.proto.encode("ascii")),
+            datetime.fromisoformat(obj.last_updated_timestamp),
+        )
+    except (ValueError, TypeError, ValidationError) as err:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(err)
+        )
+
+
+_APPLICATION_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": interface.ApplicationObject.schema(),
+            },
+            interface.PROTOBUF_MEDIA_TYPE: {
+                "schema": {"type": "string", "format": "binary"},
+            },
+        },
+    },
+}
+
+
+def get_engine_options(
+        engine_path: str,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+        pool_recycle: Optional[int] = None,
+        pool_pre_ping: bool = False,
+        statement_timeout: Optional[int] = None,
+) -> Dict[str, Any]:
+    engine_options: Dict[str, Any] = {}
+    if pool_size is not None:
+        engine_options["pool_size"] = pool_size
+    if max_overflow is not None:
+        engine_options["max_overflow"] = max_overflow
+    if pool_recycle is not None:
+        engine_options["pool_recycle"] = pool_recycle
+    if pool_pre_ping:
+        engine_options["pool_pre_ping"] = True
+
+    if statement_timeout is not None:
+        url = make_url(engine_path)
+        if url.get_backend_name() != "postgresql":
+            interface.logger.warning(
+                f"Ignoring the statement timeout, which is only supported for PostgreSQL (not {url.get_backend_name()})."
+            )
+        elif url.get_driver_name() == "asyncpg":
+            engine_options["connect_args"] = {
+                "server_settings": {"statement_timeout": str(statement_timeout)}
+            }
+        else:
+            engine_options["connect_args"] = {
+                "options": f"-c statement_timeout={statement_timeout}"
+            }
+
+    return engine_options
+
 
 def get_app(
         engine_path: str,
+        cache_max_bytes: int = 64 * 1024 * 1024,
+        cache_ttl: Optional[float] = 60.0,
+        watch_poll_interval: float = 1.0,
+        engine_options: Optional[Dict[str, Any]] = None,
+        project_metadata_ttl: Optional[float] = 1.0,
+        compression_minimum_size: Optional[int] = 1024,
+        gzip_level: int = 6,
+        zstd_level: int = 3,
+        max_request_size: Optional[int] = 64 * 1024 * 1024,
+        coalesce_reads: bool = True,
+        read_replica_paths: Optional[List[str]] = None,
+        read_your_writes_seconds: Optional[float] = None,
+        deletion_log_retention: Optional[float] = interface.DELETION_LOG_RETENTION_SECONDS,
 ):
-    app = FastAPI()
-    registry = interface.ServedSqlRegistry(
+    app = FastAPI(dependencies=[Depends(_identify_client)])
+    registry_class = interface.ServedSqlRegistry
+    if make_url(engine_path).get_dialect().is_async:
+        registry_class = interface.AsyncServedSqlRegistry
+    registry = registry_class(
         engine_path=engine_path,
+        cache_max_bytes=cache_max_bytes,
+        cache_ttl=cache_ttl,
+        engine_options=engine_options,
+        project_metadata_ttl=project_metadata_ttl,
+        coalesce_reads=coalesce_reads,
+        read_replica_paths=read_replica_paths,
+        read_your_writes_seconds=read_your_writes_seconds,
+        deletion_log_retention=deletion_log_retention,
     )
+    sync_registry = registry
+    if isinstance(registry, interface.AsyncServedSqlRegistry):
+        app.add_event_handler("startup", registry.initialize)
+        sync_registry = registry.registry
+
+    registry_metrics = metrics.RegistryMetrics(
+        sync_registry.engine,
+        caches={
+            "object": sync_registry.object_cache,
+            "project_version": sync_registry.project_versions,
+            "project_uuid": sync_registry.project_uuids,
+            "feature_service_closure": sync_registry.closure_cache,
+            "response": sync_registry.response_cache,
+        },
+        single_flight=sync_registry.single_flight,
+        read_engines=sync_registry.read_engines,
+    )
+    # Added before the metrics middleware, so that the latter records the
+    # compressed sizes of responses.
+    compressor = compression.Compressor(
+        minimum_size=compression_minimum_size,
+        gzip_level=gzip_level,
+        zstd_level=zstd_level,
+        max_request_size=max_request_size,
+    )
+    app.add_middleware(compression.CompressionMiddleware, compressor=compressor)
+    app.add_middleware(metrics.MetricsMiddleware, metrics=registry_metrics)
+
+    # Returns the project's current version, along with a 304 response if
+    # it is the one given. Bodies are otherwise tagged (and cached) with the
+    # version read along with them.
+    async def check_not_modified(
+        project: str,
+        if_none_match: Optional[str],
+        media_type: str = JSON_MEDIA_TYPE,
+    ) -> Tuple[Optional[str], Optional[Response]]:
+        version = await _call(registry._get_project_version, project)
+        etag = None if version is None else _matching_etag(_etag(version, media_type), if_none_match)
+        if etag is None:
+            return version, None
+        return version, Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Vary": "Accept, Accept-Encoding"}
+        )
+
+    def response_cache_key(project: str, endpoint: str, version: Optional[str], media_type: str):
+        if version is None:
+            return None
+        return (project, endpoint, version, media_type)
+
+    # Bodies are compressed here rather than by the middleware, so that the
+    # compressed bytes are cached under the encoding too. The project-wide
+    # bodies are encoded and compressed in the threadpool, off the event loop.
+    async def encoded_response(
+        content: bytes,
+        cache_key,
+        media_type: str,
+        response: Response,
+        accept_encoding: Optional[str],
+    ) -> Response:
+        encoding = compressor.negotiate(accept_encoding, len(content))
+        if encoding is None:
+            return _bytes_response(content, media_type, response)
+
+        compressed = None
+        if cache_key is not None:
+            compressed = registry.response_cache.get(cache_key + (encoding,))
+        if compressed is None:
+            compressed = await run_in_threadpool(compressor.compress, content, encoding)
+            if cache_key is not None:
+                registry.response_cache.set(cache_key + (encoding,), compressed)
+        encoded = _bytes_response(compressed, media_type, response)
+        encoded.headers["Content-Encoding"] = encoding
+        encoded.headers["Vary"] = "Accept, Accept-Encoding"
+        if "ETag" in encoded.headers:
+            encoded.headers["ETag"] = compression.encoded_etag(encoded.headers["ETag"], encoding)
+        return encoded
+
+    async def cached_response(
+        cache_key,
+        media_type: str,
+        response: Response,
+        accept_encoding: Optional[str],
+    ) -> Optional[Response]:
+        if cache_key is None:
+            return None
+        content = registry.response_cache.get(cache_key)
+        if content is None:
+            return None
+        _set_etag(response, cache_key[2], media_type)
+        return await encoded_response(content, cache_key, media_type, response, accept_encoding)
+
+    async def caching_json_response(
+        model,
+        cache_key,
+        response: Response,
+        accept_encoding: Optional[str],
+    ) -> Response:
+        content = await run_in_threadpool(
+            lambda: json.dumps(jsonable_encoder(model)).encode("utf-8")
+        )
+        if cache_key is not None:
+            registry.response_cache.set(cache_key, content)
+        return await encoded_response(content, cache_key, JSON_MEDIA_TYPE, response, accept_encoding)
+
+    def caching_streaming_response(
+        chunks: Union[Iterator[bytes], AsyncIterator[bytes]],
+        cache_key,
+        media_type: str,
+        response: Response,
+    ) -> StreamingResponse:
+        if cache_key is not None and registry.response_cache.max_bytes > 0:
+            chunks = _tee_chunks(
+                chunks,
+                lambda content: registry.response_cache.set(cache_key, content),
+                registry.response_cache.max_bytes,
+            )
+        return _streaming_response(chunks, media_type, response)
 
     @app.get("/health")
     def health():
         return Response(status_code=status.HTTP_200_OK)
 
+    @app.get("/cache")
+    def get_cache_stats() -> interface.ReturnCacheStats:
+        return registry._get_cache_stats()
+
+    @app.get("/metrics")
+    def get_metrics():
+        return Response(content=registry_metrics.render(), media_type=CONTENT_TYPE_LATEST)
+
     @app.get("/projects")
-    def list_projects(
+    async def list_projects(
         name_like: Optional[str] = None
     ) -> interface.ReturnStringList:
-        return registry._list_served_projects(name_like)
+        return await _call(registry._list_served_projects, name_like)
 
     @app.get("/resources")
-    def list_resources(
+    async def list_resources(
         resource: Optional[interface.QueryableResourceType] = None,
-        name_like: Optional[str] = None
+        name_like: Optional[str] = None,
+        project: Optional[str] = None,
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = None,
     ) -> interface.ReturnResourceList:
-        return registry._list_served_resources(
-            resource,
-            name_like
-        )
+        try:
+            return await _call(
+                registry._list_served_resources,
+                resource,
+                name_like,
+                project=project,
+                limit=limit,
+                cursor=cursor,
+            )
+        except ValueError as err:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(err))
 
     @app.delete("/teardown")
-    def delete_registry():
+    async def delete_registry():
         try:
-            registry.teardown()
+            await _call(registry.teardown)
         except BaseException as err:
             interface.logger.error(traceback.format_exc())
             raise HTTPException(
@@ -50,19 +462,39 @@ def get_app(
                 detail=f"{err}\n{traceback.format_exc()}"
             )
 
-    @app.post("/{project}")
-    def apply_resource(
+    @app.post("/{project}", openapi_extra=_APPLICATION_OPENAPI)
+    async def apply_resource(
         project: str,
         resource: interface.PostableResourceType,
         name: str,
-        obj_application: interface.ApplicationObject
-    ):
+        application: Tuple[bytes, datetime] = Depends(_read_application),
+    ) -> interface.ReturnApplication:
+        obj_proto_bytes, update_datetime = application
         try:
-            return registry._apply_served_object(
+            return await _call(
+                registry._apply_served_proto,
                 project=project,
                 resource=resource,
                 name=name,
-                obj=obj_application
+                obj_proto_bytes=obj_proto_bytes,
+                update_datetime=update_datetime,
+            )
+        except BaseException as err:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"{err}\n{traceback.format_exc()}"
+            )
+
+    @app.post("/{project}/batch")
+    async def apply_resources(
+        project: str,
+        batch_application: List[interface.BatchApplicationObject]
+    ) -> interface.ReturnBatchApplication:
+        try:
+            return await _call(
+                registry._apply_served_objects,
+                project=project,
+                objs=batch_application
             )
         except BaseException as err:
             raise HTTPException(
@@ -71,13 +503,28 @@ def get_app(
             )
 
     @app.delete("/{project}")
-    def delete_entity(
+    async def delete_entity(
         project: str,
-        resource: interface.DeletableResourceType,
-        name: str
+        resource: Optional[interface.DeletableResourceType] = None,
+        name: Optional[str] = None,
+        purge: bool = False,
     ) -> interface.ReturnDeletionCount:
+        # Either a single object, or with `purge` the whole project
+        if purge and (resource is not None or name is not None):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="A project is purged without a resource or name."
+            )
+        if not purge and (resource is None or name is None):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="A resource and name are required, unless purging the project."
+            )
         try:
-            return registry._delete_served_object(
+            if purge:
+                return await _call(registry._purge_served_project, project=project)
+            return await _call(
+                registry._delete_served_object,
                 resource=resource,
                 project=project,
                 name=name,
@@ -92,17 +539,83 @@ def get_app(
             )
 
     @app.get("/{project}")
-    def get_resource(
+    async def get_resource(
         project: str,
         resource: interface.GettableResourceType,
         name: str,
+        response: Response,
+        if_none_match: Optional[str] = Header(None),
+        accept: Optional[str] = Header(None),
     ) -> interface.ReturnObject:
+        media_type = JSON_MEDIA_TYPE
+        if _accepts(accept, interface.PROTOBUF_MEDIA_TYPE):
+            media_type = interface.PROTOBUF_MEDIA_TYPE
+        version, not_modified = await check_not_modified(project, if_none_match, media_type)
+        if not_modified is not None:
+            return not_modified
         try:
-            return registry._get_served_object(
+            if media_type == interface.PROTOBUF_MEDIA_TYPE:
+                version, proto_bytes = await _call(
+                    registry._get_served_object_bytes_versioned,
+                    resource=resource,
+                    project=project,
+                    name=name
+                )
+                _set_etag(response, version, media_type)
+                return _bytes_response(proto_bytes, interface.PROTOBUF_MEDIA_TYPE, response)
+            version, obj = await _call(
+                registry._get_served_object_versioned,
                 resource=resource,
                 project=project,
                 name=name
             )
+            _set_etag(response, version)
+            return obj
+        except FeastObjectNotFoundException as err:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(err))
+        except BaseException as err:
+            interface.logger.error(traceback.format_exc())
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"{err}\n{traceback.format_exc()}"
+            )
+
+    @app.post("/{project}/get_many")
+    async def get_resources(
+        project: str,
+        refs: List[interface.ObjectReference],
+    ) -> interface.ReturnObjects:
+        try:
+            return await _call(
+                registry._get_served_objects,
+                project=project,
+                refs=refs,
+            )
+        except BaseException as err:
+            interface.logger.error(traceback.format_exc())
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"{err}\n{traceback.format_exc()}"
+            )
+
+    @app.get("/{project}/feature_service/{name}/closure")
+    async def get_feature_service_closure(
+        project: str,
+        name: str,
+        response: Response,
+        if_none_match: Optional[str] = Header(None),
+    ) -> interface.ReturnObjects:
+        version, not_modified = await check_not_modified(project, if_none_match)
+        if not_modified is not None:
+            return not_modified
+        try:
+            version, closure = await _call(
+                registry._get_served_feature_service_closure_versioned,
+                project=project,
+                name=name,
+            )
+            _set_etag(response, version)
+            return closure
         except FeastObjectNotFoundException as err:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(err))
         except BaseException as err:
@@ -113,15 +626,61 @@ def get_app(
             )
 
     @app.get("/{project}/list")
-    def list_resource(
+    async def list_resource(
         project: str,
         resource: interface.QueryableResourceType,
+        response: Response,
+        if_none_match: Optional[str] = Header(None),
+        accept: Optional[str] = Header(None),
+        accept_encoding: Optional[str] = Header(None),
     ) -> interface.ReturnObjectList:
+        media_type = JSON_MEDIA_TYPE
+        encode = None
+        if _accepts(accept, interface.PROTOBUF_MEDIA_TYPE):
+            media_type = interface.PROTOBUF_MEDIA_TYPE
+            encode = interface._encode_length_delimited
+        elif _accepts(accept, interface.NDJSON_MEDIA_TYPE):
+            media_type = interface.NDJSON_MEDIA_TYPE
+            encode = interface._encode_ndjson_line
+        version, not_modified = await check_not_modified(project, if_none_match, media_type)
+        if not_modified is not None:
+            return not_modified
+        endpoint = f"list/{resource.value}"
+        cached = await cached_response(
+            response_cache_key(project, endpoint, version, media_type),
+            media_type,
+            response,
+            accept_encoding
+        )
+        if cached is not None:
+            return cached
         try:
-            return registry._list_served_objects(
+            if encode is not None:
+                version, items = await _split_version(
+                    registry._iter_served_object_bytes_versioned(
+                        project=project,
+                        resource=resource,
+                    )
+                )
+                _set_etag(response, version, media_type)
+                return caching_streaming_response(
+                    _map_items(encode, items),
+                    response_cache_key(project, endpoint, version, media_type),
+                    media_type,
+                    response
+                )
+            version, object_list = await _call(
+                registry._list_served_objects_versioned,
                 project=project,
                 resource=resource,
             )
+            _set_etag(response, version)
+            return await caching_json_response(
+                object_list,
+                response_cache_key(project, endpoint, version, media_type),
+                response,
+                accept_encoding
+            )
         except FeastObjectNotFoundException as err:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(err))
         except BaseException as err:
@@ -131,23 +690,148 @@ def get_app(
                 detail=f"{err}\n{traceback.format_exc()}"
             )
 
+    @app.get("/{project}/snapshot")
+    async def get_snapshot(
+        project: str,
+        response: Response,
+        if_none_match: Optional[str] = Header(None),
+        accept: Optional[str] = Header(None),
+        accept_encoding: Optional[str] = Header(None),
+    ) -> interface.ReturnObject:
+        media_type = JSON_MEDIA_TYPE
+        if _accepts(accept, interface.PROTOBUF_MEDIA_TYPE):
+            media_type = interface.PROTOBUF_MEDIA_TYPE
+        version, not_modified = await check_not_modified(project, if_none_match, media_type)
+        if not_modified is not None:
+            return not_modified
+        cached = await cached_response(
+            response_cache_key(project, "snapshot", version, media_type),
+            media_type,
+            response,
+            accept_encoding
+        )
+        if cached is not None:
+            return cached
+        try:
+            if media_type == interface.PROTOBUF_MEDIA_TYPE:
+                version, chunks = await _split_version(
+                    registry._iter_served_snapshot_bytes_versioned(
+                        project=project,
+                    )
+                )
+                _set_etag(response, version, media_type)
+                return caching_streaming_response(
+                    chunks,
+                    response_cache_key(project, "snapshot", version, media_type),
+                    media_type,
+                    response
+                )
+            version, snapshot = await _call(
+                registry._get_served_snapshot_versioned,
+                project=project,
+            )
+            _set_etag(response, version)
+            return await caching_json_response(
+                snapshot,
+                response_cache_key(project, "snapshot", version, media_type),
+                response,
+                accept_encoding
+            )
+        except BaseException as err:
+            interface.logger.error(traceback.format_exc())
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"{err}\n{traceback.format_exc()}"
+            )
+
+    @app.get("/{project}/changes")
+    async def list_changes(
+        project: str,
+        since: datetime,
+        response: Response,
+        if_none_match: Optional[str] = Header(None),
+    ) -> interface.ReturnChanges:
+        version, not_modified = await check_not_modified(project, if_none_match)
+        if not_modified is not None:
+            return not_modified
+        try:
+            version, changes = await _call(
+                registry._list_served_changes_versioned,
+                project=project,
+                since=since,
+            )
+            _set_etag(response, version)
+            return changes
+        except interface.ChangesNotRetained as err:
+            raise HTTPException(status_code=status.HTTP_410_GONE, detail=str(err))
+        except BaseException as err:
+            interface.logger.error(traceback.format_exc())
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"{err}\n{traceback.format_exc()}"
+            )
+
+    @app.get("/{project}/watch")
+    async def watch_project(
+        project: str,
+        version: Optional[str] = None,
+        timeout: float = Query(30.0, ge=0, le=300),
+    ) -> interface.ReturnWatch:
+        # Long-poll until the project's version moves from the given one.
+        # In-process writes wake the wait immediately, while the version row
+        # is re-read every poll interval to pick up other workers' writes.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        if version is not None:
+            version = _etag_version(version)
+        try:
+            current_version = await _call(registry._get_project_version, project)
+            while current_version == version:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                await registry.change_notifier.wait(
+                    project, min(remaining, watch_poll_interval)
+                )
+                current_version = await _call(
+                    registry._get_project_version, project
+                )
+
+            return await _call(
+                registry._watch_served_changes,
+                project=project,
+                version=version,
+                current_version=current_version,
+            )
+        except interface.ChangesNotRetained as err:
+            raise HTTPException(status_code=status.HTTP_410_GONE, detail=str(err))
+        except BaseException as err:
+            interface.logger.error(traceback.format_exc())
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"{err}\n{traceback.format_exc()}"
+            )
+
     @app.get("/{project}/last_updated")
-    def get_last_updated(
+    async def get_last_updated(
         project: str
     ) -> interface.ReturnDatetime:
         return interface.ReturnDatetime(
-            datetime=registry._get_last_updated_metadata(project).isoformat()
+            datetime=(
+                await _call(registry._get_last_updated_metadata, project)
+            ).isoformat()
         )
 
     @app.post("/{project}/user_metadata")
-    def apply_resource_user_metadata(
+    async def apply_resource_user_metadata(
         project: str,
         resource: interface.FeatureViewResourceType,
         name: str,
         obj_application: interface.ApplicationObject
     ):
         try:
-            return registry._apply_served_user_metadata(
+            return await _call(
+                registry._apply_served_user_metadata,
                 resource=resource,
                 project=project,
                 name=name,
@@ -163,17 +847,25 @@ def get_app(
             )
 
     @app.get("/{project}/user_metadata")
-    def get_resource_user_metadata(
+    async def get_resource_user_metadata(
         project: str,
         resource: interface.FeatureViewResourceType,
         name: str,
+        response: Response,
+        if_none_match: Optional[str] = Header(None),
     ) -> interface.ReturnObject:
+        version, not_modified = await check_not_modified(project, if_none_match)
+        if not_modified is not None:
+            return not_modified
         try:
-            return registry._get_served_user_metadata(
+            version, user_metadata = await _call(
+                registry._get_served_user_metadata_versioned,
                 resource=resource,
                 name=name,
                 project=project
             )
+            _set_etag(response, version)
+            return user_metadata
         except FeastObjectNotFoundException as err:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(err))
         except BaseException as err:
@@ -184,13 +876,36 @@ def get_app(
             )
 
     @app.get("/{project}/feast_metadata")
-    def list_project_metadata(
+    async def list_project_metadata(
         project: str,
+        response: Response,
+        if_none_match: Optional[str] = Header(None),
+        accept_encoding: Optional[str] = Header(None),
     ) -> interface.ReturnObjectList:
+        version, not_modified = await check_not_modified(project, if_none_match)
+        if not_modified is not None:
+            return not_modified
+
+        cached = await cached_response(
+            response_cache_key(project, "feast_metadata", version, JSON_MEDIA_TYPE),
+            JSON_MEDIA_TYPE,
+            response,
+            accept_encoding
+        )
+        if cached is not None:
+            return cached
         try:
-            return registry._list_served_project_metadata(
+            version, project_metadata = await _call(
+                registry._list_served_project_metadata_versioned,
                 project=project
             )
+            _set_etag(response, version)
+            return await caching_json_response(
+                project_metadata,
+                response_cache_key(project, "feast_metadata", version, JSON_MEDIA_TYPE),
+                response,
+                accept_encoding
+            )
         except FeastObjectNotFoundException as err:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(err))
         except BaseException as err:
@@ -203,6 +918,13 @@ def get_app(
     return app, registry
 
 
+def create_app():
+    # An app factory for uvicorn's `--factory` and gunicorn, so that each
+    # worker process creates its own engine (and connection pool).
+    app, _ = get_app(**json.loads(os.environ[APP_OPTIONS_ENV_VAR]))
+    return app
+
+
 def cli_start_server():
     parser = argparse.ArgumentParser(
         description="Start the REST server for a FEAST SQL Registry.",
@@ -225,6 +947,118 @@ def cli_start_server():
         default=8000,
         help="The port to serve on.",
     )
+    parser.add_argument(
+        "--cache-max-bytes",
+        type=int,
+        default=64 * 1024 * 1024,
+        help="The memory cap of the registry object cache (0 disables it).",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=60.0,
+        help="The seconds for which a cached registry object remains valid.",
+    )
+    parser.add_argument(
+        "--project-metadata-ttl",
+        type=float,
+        default=1.0,
+        help="The seconds for which a cached project version remains valid, which bounds how long other workers' writes go unseen.",
+    )
+    parser.add_argument(
+        "--watch-poll-interval",
+        type=float,
+        default=1.0,
+        help="The seconds between database checks of a project watched for changes.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="The number of worker processes to serve with.",
+    )
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=None,
+        help="The number of connections each worker keeps open (SQLAlchemy's default when unset).",
+    )
+    parser.add_argument(
+        "--max-overflow",
+        type=int,
+        default=None,
+        help="The number of connections each worker may open beyond the pool size.",
+    )
+    parser.add_argument(
+        "--pool-recycle",
+        type=int,
+        default=None,
+        help="The seconds after which a pooled connection is replaced.",
+    )
+    parser.add_argument(
+        "--pool-pre-ping",
+        action="store_true",
+        help="Test pooled connections for liveness before use.",
+    )
+    parser.add_argument(
+        "--statement-timeout",
+        type=int,
+        default=None,
+        help="The milliseconds after which a query is cancelled (PostgreSQL only).",
+    )
+    parser.add_argument(
+        "--read-replica",
+        type=str,
+        action="append",
+        default=None,
+        help="The SQL alchemy engine path of a read replica of the database, across which reads are spread (repeatable).",
+    )
+    parser.add_argument(
+        "--read-your-writes",
+        type=float,
+        default=None,
+        help="The seconds for which a client's reads go to the primary after it writes, if there are read replicas.",
+    )
+    parser.add_argument(
+        "--deletion-log-retention",
+        type=float,
+        default=interface.DELETION_LOG_RETENTION_SECONDS,
+        help="The seconds for which deletions are logged for /{project}/changes and /{project}/watch, which answer 410 for anything older.",
+    )
+    parser.add_argument(
+        "--no-read-coalescing",
+        action="store_true",
+        help="Query the database for each of several identical reads in flight at once.",
+    )
+    parser.add_argument(
+        "--compression-minimum-size",
+        type=int,
+        default=1024,
+        help="The bytes from which responses are compressed, if the client accepts gzip or zstd.",
+    )
+    parser.add_argument(
+        "--no-compression",
+        action="store_true",
+        help="Leave responses uncompressed (compressed requests are still accepted).",
+    )
+    parser.add_argument(
+        "--gzip-level",
+        type=int,
+        default=6,
+        help="The gzip compression level, from 1 (fastest) to 9 (smallest).",
+    )
+    parser.add_argument(
+        "--zstd-level",
+        type=int,
+        default=3,
+        help="The zstd compression level, from 1 (fastest) to 22 (smallest), if zstandard is installed.",
+    )
+    parser.add_argument(
+        "--max-request-size",
+        type=int,
+        default=64 * 1024 * 1024,
+        help="The bytes to which compressed request bodies may decompress, beyond which they are answered 413.",
+    )
     parser.add_argument(
         "-l", "--log-path",
         type=str,
@@ -247,7 +1081,29 @@ def cli_start_server():
         logging.ERROR, logging.WARNING, logging.INFO, logging.DEBUG
     ][args.verbose]
 
-    app, registry = get_app(args.engine_path)
+    os.environ[APP_OPTIONS_ENV_VAR] = json.dumps({
+        "engine_path": args.engine_path,
+        "cache_max_bytes": args.cache_max_bytes,
+        "cache_ttl": args.cache_ttl,
+        "project_metadata_ttl": args.project_metadata_ttl,
+        "watch_poll_interval": args.watch_poll_interval,
+        "engine_options": get_engine_options(
+            args.engine_path,
+            pool_size=args.pool_size,
+            max_overflow=args.max_overflow,
+            pool_recycle=args.pool_recycle,
+            pool_pre_ping=args.pool_pre_ping,
+            statement_timeout=args.statement_timeout,
+        ),
+        "compression_minimum_size": None if args.no_compression else args.compression_minimum_size,
+        "gzip_level": args.gzip_level,
+        "zstd_level": args.zstd_level,
+        "max_request_size": args.max_request_size,
+        "coalesce_reads": not args.no_read_coalescing,
+        "read_replica_paths": args.read_replica,
+        "read_your_writes_seconds": args.read_your_writes,
+        "deletion_log_retention": args.deletion_log_retention,
+    })
 
     logger_handler_dict = {
         "level": logger_level,
@@ -264,7 +1120,9 @@ def cli_start_server():
         }
 
     uvicorn.run(
-        app,
+        "feast_rest_registry.server:create_app",
+        factory=True,
+        workers=args.workers,
         host=args.host,
         port=args.port,
         log_config={
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Any = None
+
+
+class SingleFlight:
+    # Coalesces concurrent calls: a call made while another with the same
+    # key is in flight waits for, and shares, that call's result (or
+    # exception) instead of running again. Keys are tuples led by the
+    # method's name, which labels the counts.
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._async_calls: Dict[Hashable, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self.calls: Dict[str, int] = defaultdict(int)
+        self.coalesced: Dict[str, int] = defaultdict(int)
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.calls[key[0]] += 1
+            else:
+                self.coalesced[key[0]] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        # The coroutine runs as a task of its own, so that the cancellation
+        # of any one caller (e.g. on a disconnect) leaves the others waiting.
+        with self._lock:
+            task = self._async_calls.get(key)
+            if task is None:
+                task = asyncio.ensure_future(fn(*args, **kwargs))
+                self._async_calls[key] = task
+                self.calls[key[0]] += 1
+
+                def on_done(task):
+                    with self._lock:
+                        if self._async_calls.get(key) is task:
+                            del self._async_calls[key]
+                    if not task.cancelled():
+                        # retrieved, in case every caller was cancelled
+                        task.exception()
+                task.add_done_callback(on_done)
+            else:
+                self.coalesced[key[0]] += 1
+        return await asyncio.shield(task)
+
+    def forget_where(self, predicate: Callable[[Hashable], bool]):
+        # Later calls run afresh rather than sharing the matching calls in
+        # flight, which may have read from before a write.
+        with self._lock:
+            for calls in (self._calls, self._async_calls):
+                for key in [k for k in calls if predicate(k)]:
+                    del calls[key]
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                "calls": dict(self.calls),
+                "coalesced": dict(self.coalesced),
+            }
@@ -0,0 +1,21 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from feast_rest_registry import server
+
+
+@pytest.fixture
+def engine_path(tmp_path):
+    return f"sqlite:///{tmp_path / 'registry.db'}"
+
+
+@pytest.fixture
+def app_registry(engine_path):
+    app, registry = server.get_app(engine_path)
+    yield app, registry
+    registry.engine.dispose()
+
+
+@pytest.fixture
+def client(app_registry):
+    return TestClient(app_registry[0])
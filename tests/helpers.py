@@ -0,0 +1,56 @@
+import base64
+from datetime import datetime
+
+from google.protobuf.internal.decoder import _DecodeVarint
+
+from feast.protos.feast.core.Entity_pb2 import Entity as EntityProto
+
+
+def entity_proto(name: str, description: str = "") -> EntityProto:
+    proto = EntityProto()
+    proto.spec.name = name
+    proto.spec.description = description
+    return proto
+
+
+def application(proto) -> dict:
+    return {
+        "proto": base64.b64encode(proto.SerializeToString()).decode("ascii"),
+        "last_updated_timestamp": datetime.utcnow().isoformat(),
+    }
+
+
+def entity_application(name: str, description: str = "") -> dict:
+    return application(entity_proto(name, description))
+
+
+def descriptions(response) -> list:
+    return [
+        EntityProto.FromString(base64.b64decode(protostring)).spec.description
+        for protostring in response.json()["protostrings"]
+    ]
+
+
+def apply_entity(client, project: str, name: str, description: str = "", **kwargs):
+    response = client.post(
+        f"/{project}",
+        params={"resource": "entity", "name": name},
+        json=entity_application(name, description),
+        **kwargs,
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def list_entities(client, project: str, **kwargs):
+    return client.get(f"/{project}/list", params={"resource": "entity"}, **kwargs)
+
+
+def decode_length_delimited(content: bytes) -> list:
+    # The (name, proto) pairs of a protobuf listing
+    fields, position = [], 0
+    while position < len(content):
+        size, position = _DecodeVarint(content, position)
+        fields.append(content[position:position + size])
+        position += size
+    return list(zip(fields[::2], fields[1::2]))
@@ -0,0 +1,50 @@
+import base64
+from unittest import mock
+
+from feast.protos.feast.core.Entity_pb2 import Entity as EntityProto
+
+from feast_rest_registry import interface
+
+from tests.helpers import apply_entity, entity_proto, list_entities
+
+
+def get_entity(client, project: str, name: str) -> EntityProto:
+    response = client.get(f"/{project}", params={"resource": "entity", "name": name})
+    return EntityProto.FromString(base64.b64decode(response.json()["protostring"]))
+
+
+def test_only_new_objects_are_stamped_with_their_creation(client):
+    stamp = mock.Mock(wraps=interface._stamp_created_timestamp)
+    with mock.patch.object(interface, "_stamp_created_timestamp", stamp):
+        apply_entity(client, "project", "entity", "v1")
+        assert stamp.call_count == 1
+        created = get_entity(client, "project", "entity").meta.created_timestamp
+        assert created.seconds > 0
+
+        apply_entity(client, "project", "entity", "v2")
+        assert stamp.call_count == 1
+    updated = get_entity(client, "project", "entity")
+    assert updated.spec.description == "v2"
+
+
+def test_apply_reports_status(client):
+    assert apply_entity(client, "project", "entity", "v1")["status"] == "created"
+    assert apply_entity(client, "project", "entity", "v1")["status"] == "unchanged"
+    assert apply_entity(client, "project", "entity", "v2")["status"] == "updated"
+
+
+def test_unchanged_apply_leaves_the_version(client):
+    apply_entity(client, "project", "entity", "v1")
+    etag = list_entities(client, "project").headers["etag"]
+
+    # Differing only in the meta timestamps clients restamp on every apply
+    proto = entity_proto("entity", "v1")
+    proto.meta.last_updated_timestamp.GetCurrentTime()
+    response = client.post(
+        "/project",
+        params={"resource": "entity", "name": "entity"},
+        content=proto.SerializeToString(),
+        headers={"Content-Type": "application/x-protobuf"},
+    )
+    assert response.json() == {"status": "unchanged"}
+    assert list_entities(client, "project").headers["etag"] == etag
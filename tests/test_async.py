@@ -0,0 +1,53 @@
+import base64
+
+import pytest
+from fastapi.testclient import TestClient
+
+from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
+
+from feast_rest_registry import interface, server
+
+from tests.helpers import apply_entity, decode_length_delimited, descriptions, list_entities
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture
+def async_client(tmp_path):
+    app, registry = server.get_app(f"sqlite+aiosqlite:///{tmp_path / 'registry.db'}")
+    assert isinstance(registry, interface.AsyncServedSqlRegistry)
+    # Entered, so that the startup handler creates the tables
+    with TestClient(app) as client:
+        yield client
+
+
+def test_reads_and_writes(async_client):
+    apply_entity(async_client, "project", "a", "v1")
+    apply_entity(async_client, "project", "b", "v1")
+    apply_entity(async_client, "project", "a", "v2")
+
+    response = async_client.get("/project", params={"resource": "entity", "name": "a"})
+    assert response.status_code == 200
+    assert sorted(descriptions(list_entities(async_client, "project"))) == ["v1", "v2"]
+    assert async_client.get("/projects").json()["strings"] == ["project"]
+
+    response = async_client.get("/project", params={"resource": "entity", "name": "missing"})
+    assert response.status_code == 404
+
+    assert async_client.delete(
+        "/project", params={"resource": "entity", "name": "b"}
+    ).json() == {"count": 1}
+    assert descriptions(list_entities(async_client, "project")) == ["v2"]
+
+
+def test_streams(async_client):
+    apply_entity(async_client, "project", "a")
+
+    response = list_entities(async_client, "project", headers={"Accept": "application/x-protobuf"})
+    assert [name for name, _ in decode_length_delimited(response.content)] == [b"a"]
+
+    response = async_client.get("/project/snapshot", headers={"Accept": "application/x-protobuf"})
+    assert [e.spec.name for e in RegistryProto.FromString(response.content).entities] == ["a"]
+    response = async_client.get("/project/snapshot")
+    snapshot = RegistryProto.FromString(base64.b64decode(response.json()["protostring"]))
+    assert [e.spec.name for e in snapshot.entities] == ["a"]
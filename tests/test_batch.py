@@ -0,0 +1,59 @@
+from tests.helpers import descriptions, entity_application, list_entities
+
+
+def batch(client, project: str, descriptions_by_name: dict):
+    response = client.post(
+        f"/{project}/batch",
+        json=[
+            {
+                "resource": "entity",
+                "name": name,
+                "obj": entity_application(name, description),
+            }
+            for name, description in descriptions_by_name.items()
+        ],
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_batch_inserts_updates_and_skips_unchanged(client):
+    objs = {f"entity_{i}": "v1" for i in range(3)}
+    assert batch(client, "project", objs) == {"inserted": 3, "updated": 0, "unchanged": 0}
+    etag = list_entities(client, "project").headers["etag"]
+
+    assert batch(client, "project", objs) == {"inserted": 0, "updated": 0, "unchanged": 3}
+    assert list_entities(client, "project").headers["etag"] == etag
+
+    objs["entity_0"] = "v2"
+    objs["entity_3"] = "v1"
+    assert batch(client, "project", objs) == {"inserted": 1, "updated": 1, "unchanged": 2}
+    response = list_entities(client, "project")
+    assert response.headers["etag"] != etag
+    assert sorted(descriptions(response)) == ["v1", "v1", "v1", "v2"]
+
+
+def test_batch_larger_than_a_chunk(client):
+    objs = {f"entity_{i}": "v1" for i in range(1200)}
+    assert batch(client, "project", objs)["inserted"] == 1200
+    objs["entity_1100"] = "v2"
+    assert batch(client, "project", objs) == {"inserted": 0, "updated": 1, "unchanged": 1199}
+
+
+def test_batch_is_applied_in_one_transaction(client):
+    response = client.post(
+        "/project/batch",
+        json=[
+            {"resource": "entity", "name": "entity", "obj": entity_application("entity")},
+            {
+                "resource": "feature_view",
+                "name": "broken",
+                "obj": {**entity_application("broken"), "proto": "not base64!"},
+            },
+        ],
+    )
+    assert response.status_code == 500
+    assert descriptions(list_entities(client, "project")) == []
+
+    assert batch(client, "project", {"entity": "v1"})["inserted"] == 1
+
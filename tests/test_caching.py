@@ -0,0 +1,28 @@
+from feast_rest_registry.cache import LRUCache
+
+from tests.helpers import apply_entity, descriptions, list_entities
+
+
+def test_write_invalidates_cached_object_and_listing(client):
+    apply_entity(client, "project", "entity", "v1")
+    params = {"resource": "entity", "name": "entity"}
+    assert client.get("/project", params=params).status_code == 200
+    assert descriptions(list_entities(client, "project")) == ["v1"]
+
+    hits = client.get("/cache").json()["hits"]
+    assert client.get("/project", params=params).status_code == 200
+    assert client.get("/cache").json()["hits"] > hits
+
+    apply_entity(client, "project", "entity", "v2")
+    assert descriptions(list_entities(client, "project")) == ["v2"]
+
+
+def test_cache_bounded_by_entries_alone():
+    cache = LRUCache(max_entries=2)
+    for key in ("a", "b"):
+        cache.set(key, object())
+    cache.get("a")
+    cache.set("c", object())
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+from feast_rest_registry import server
+
+from tests.helpers import apply_entity, entity_application
+
+
+def changes(client, project: str, since: datetime):
+    return client.get(f"/{project}/changes", params={"since": since.isoformat()})
+
+
+def test_changes_since(client):
+    start = datetime.utcnow() - timedelta(seconds=1)
+    apply_entity(client, "project", "kept")
+    apply_entity(client, "project", "deleted")
+    assert client.delete(
+        "/project", params={"resource": "entity", "name": "deleted"}
+    ).json() == {"count": 1}
+
+    response = changes(client, "project", start)
+    assert response.status_code == 200
+    body = response.json()
+    assert [obj["name"] for obj in body["objects"]] == ["kept"]
+    assert [(d["type"], d["name"]) for d in body["deletions"]] == [("entity", "deleted")]
+
+    body = changes(client, "project", datetime.fromisoformat(body["last_updated"]) + timedelta(seconds=1)).json()
+    assert body["objects"] == [] and body["deletions"] == []
+
+
+def test_changes_are_stamped_by_the_server(client):
+    start = datetime.utcnow() - timedelta(seconds=1)
+    response = client.post(
+        "/project",
+        params={"resource": "entity", "name": "entity"},
+        json={**entity_application("entity"), "last_updated_timestamp": "2001-01-01T00:00:00"},
+    )
+    assert response.status_code == 200
+    assert [obj["name"] for obj in changes(client, "project", start).json()["objects"]] == ["entity"]
+
+
+def test_changes_beyond_retention_are_gone(engine_path):
+    app, _ = server.get_app(engine_path, deletion_log_retention=60)
+    client = TestClient(app)
+    apply_entity(client, "project", "entity")
+    assert changes(client, "project", datetime.utcnow() - timedelta(seconds=30)).status_code == 200
+    assert changes(client, "project", datetime.utcnow() - timedelta(hours=1)).status_code == 410
+
@@ -0,0 +1,70 @@
+from feast.protos.feast.core.DataSource_pb2 import DataSource as DataSourceProto
+from feast.protos.feast.core.FeatureService_pb2 import FeatureService as FeatureServiceProto
+from feast.protos.feast.core.FeatureView_pb2 import FeatureView as FeatureViewProto
+from feast.protos.feast.core.OnDemandFeatureView_pb2 import (
+    OnDemandFeatureView as OnDemandFeatureViewProto,
+)
+
+from tests.helpers import apply_entity, application
+
+
+def apply(client, project: str, resource: str, name: str, proto):
+    response = client.post(
+        f"/{project}", params={"resource": resource, "name": name}, json=application(proto)
+    )
+    assert response.status_code == 200, response.text
+
+
+def feature_service(name: str, *feature_view_names: str) -> FeatureServiceProto:
+    proto = FeatureServiceProto()
+    proto.spec.name = name
+    for feature_view_name in feature_view_names:
+        proto.spec.features.add(feature_view_name=feature_view_name)
+    return proto
+
+
+def test_closure_follows_feature_views(client):
+    feature_view = FeatureViewProto()
+    feature_view.spec.name = "driver_stats"
+    feature_view.spec.entities.append("driver")
+    feature_view.spec.batch_source.name = "driver_source"
+    apply(client, "project", "feature_view", "driver_stats", feature_view)
+
+    # An on-demand feature view, sourcing the feature view above
+    on_demand = OnDemandFeatureViewProto()
+    on_demand.spec.name = "driver_ratios"
+    on_demand.spec.sources["stats"].feature_view_projection.feature_view_name = "driver_stats"
+    apply(client, "project", "on_demand_feature_view", "driver_ratios", on_demand)
+
+    apply_entity(client, "project", "driver")
+    apply(client, "project", "data_source", "driver_source", DataSourceProto(name="driver_source"))
+    apply_entity(client, "project", "unrelated")
+    apply(
+        client, "project", "feature_service", "service",
+        feature_service("service", "driver_ratios", "missing_view"),
+    )
+
+    response = client.get("/project/feature_service/service/closure")
+    assert response.status_code == 200
+    body = response.json()
+    assert sorted((obj["type"], obj["name"]) for obj in body["objects"]) == [
+        ("data_source", "driver_source"),
+        ("entity", "driver"),
+        ("feature_service", "service"),
+        ("feature_view", "driver_stats"),
+        ("on_demand_feature_view", "driver_ratios"),
+    ]
+    assert [(ref["type"], ref["name"]) for ref in body["missing"]] == [
+        ("feature_view", "missing_view")
+    ]
+
+    etag = response.headers["etag"]
+    response = client.get(
+        "/project/feature_service/service/closure", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+
+def test_closure_of_missing_feature_service(client):
+    apply_entity(client, "project", "entity")
+    assert client.get("/project/feature_service/missing/closure").status_code == 404
@@ -0,0 +1,103 @@
+import gzip
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from feast_rest_registry import server
+from tests.helpers import descriptions, entity_application, list_entities
+
+
+def test_gzip_request_body(client):
+    body = json.dumps(entity_application("entity", "compressed")).encode()
+    response = client.post(
+        "/project",
+        params={"resource": "entity", "name": "entity"},
+        content=gzip.compress(body),
+        headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+    )
+    assert response.status_code == 200, response.text
+    assert descriptions(list_entities(client, "project")) == ["compressed"]
+
+
+def test_corrupt_request_body(client):
+    response = client.post(
+        "/project",
+        params={"resource": "entity", "name": "entity"},
+        content=b"not gzip",
+        headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+    )
+    assert response.status_code == 415
+
+
+@pytest.fixture
+def small_request_client(engine_path):
+    app, registry = server.get_app(engine_path, max_request_size=1024)
+    yield TestClient(app)
+    registry.engine.dispose()
+
+
+def test_oversize_request_body(small_request_client):
+    # Small once compressed, but well beyond the maximum once decompressed
+    body = json.dumps(entity_application("entity", "x" * 100_000)).encode()
+    response = small_request_client.post(
+        "/project",
+        params={"resource": "entity", "name": "entity"},
+        content=gzip.compress(body),
+        headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+    )
+    assert response.status_code == 413
+    assert descriptions(list_entities(small_request_client, "project")) == []
+
+
+def test_oversize_zstd_request_body(small_request_client):
+    zstandard = pytest.importorskip("zstandard")
+    body = json.dumps(entity_application("entity", "x" * 100_000)).encode()
+    response = small_request_client.post(
+        "/project",
+        params={"resource": "entity", "name": "entity"},
+        content=zstandard.ZstdCompressor().compress(body),
+        headers={"Content-Encoding": "zstd", "Content-Type": "application/json"},
+    )
+    assert response.status_code == 413
+
+
+def test_truncated_request_body(client):
+    body = gzip.compress(json.dumps(entity_application("entity")).encode())
+    response = client.post(
+        "/project",
+        params={"resource": "entity", "name": "entity"},
+        content=body[:len(body) // 2],
+        headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+    )
+    assert response.status_code == 415
+
+
+def test_gzip_responses(client):
+    for i in range(20):
+        client.post(
+            "/project",
+            params={"resource": "entity", "name": f"entity_{i}"},
+            json=entity_application(f"entity_{i}", "x" * 100),
+        )
+
+    small = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+    # Encoded once, then served from the response cache
+    for _ in range(2):
+        response = list_entities(client, "project", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(descriptions(response)) == 20
+
+    streamed = list_entities(
+        client,
+        "project",
+        headers={"Accept-Encoding": "gzip", "Accept": "application/x-ndjson"},
+    )
+    assert streamed.headers["content-encoding"] == "gzip"
+    assert len(streamed.text.splitlines()) == 20
+
+    plain = list_entities(client, "project", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert len(descriptions(plain)) == 20
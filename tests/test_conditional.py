@@ -0,0 +1,69 @@
+from tests.helpers import apply_entity, descriptions, list_entities
+
+
+def test_not_modified_until_written(client):
+    apply_entity(client, "project", "entity", "v1")
+    etag = list_entities(client, "project").headers["etag"]
+
+    response = list_entities(client, "project", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+    apply_entity(client, "project", "entity", "v2")
+    response = list_entities(client, "project", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert descriptions(response) == ["v2"]
+
+
+def test_etag_is_per_project(client):
+    apply_entity(client, "project", "entity")
+    params = {"resource": "entity", "name": "entity"}
+    etag = client.get("/project", params=params).headers["etag"]
+
+    apply_entity(client, "other", "entity")
+    response = client.get("/project", params=params, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    response = client.get("/project", params=params, headers={"If-None-Match": f'"other", {etag}'})
+    assert response.status_code == 304
+    response = client.get("/project", params=params, headers={"If-None-Match": '"other"'})
+    assert response.status_code == 200
+
+
+def test_etag_is_per_representation(client):
+    for i in range(20):
+        apply_entity(client, "project", f"entity_{i}", "x" * 100)
+    representations = {
+        "json": {"Accept-Encoding": "identity"},
+        "protobuf": {"Accept-Encoding": "identity", "Accept": "application/x-protobuf"},
+        "ndjson": {"Accept-Encoding": "identity", "Accept": "application/x-ndjson"},
+        "gzip": {"Accept-Encoding": "gzip"},
+        "protobuf_gzip": {"Accept-Encoding": "gzip", "Accept": "application/x-protobuf"},
+    }
+    etags = {
+        name: list_entities(client, "project", headers=headers).headers["etag"]
+        for name, headers in representations.items()
+    }
+    assert len(set(etags.values())) == len(etags)
+    assert etags["gzip"] == etags["json"][:-1] + '-gzip"'
+
+    # Each revalidates only its own representation, in whichever encoding
+    response = list_entities(
+        client,
+        "project",
+        headers={**representations["json"], "If-None-Match": etags["protobuf"]},
+    )
+    assert response.status_code == 200
+    response = list_entities(
+        client,
+        "project",
+        headers={**representations["protobuf"], "If-None-Match": etags["protobuf_gzip"]},
+    )
+    assert response.status_code == 304
+    assert response.headers["etag"] == etags["protobuf_gzip"]
+
+    # Any representation's ETag names the version to watch from
+    for etag in etags.values():
+        response = client.get("/project/watch", params={"version": etag.strip('"'), "timeout": 0})
+        assert response.json()["updated"] == []
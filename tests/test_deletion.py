@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta
+
+from tests.helpers import apply_entity, descriptions, list_entities
+
+
+def test_purge_removes_only_the_project(client):
+    start = datetime.utcnow() - timedelta(seconds=1)
+    for name in ("a", "b"):
+        apply_entity(client, "purged", name, "purged")
+    apply_entity(client, "kept", "a", "kept")
+    etag = list_entities(client, "purged").headers["etag"]
+    assert descriptions(list_entities(client, "purged")) == ["purged", "purged"]
+
+    assert client.delete("/purged", params={"purge": True}).json() == {"count": 2}
+    response = list_entities(client, "purged", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert descriptions(response) == []
+    assert descriptions(list_entities(client, "kept")) == ["kept"]
+
+    deletions = client.get("/purged/changes", params={"since": start.isoformat()}).json()["deletions"]
+    assert "project" in [d["type"] for d in deletions]
+
+
+def test_purge_rejects_a_resource(client):
+    response = client.delete("/project", params={"purge": True, "resource": "entity"})
+    assert response.status_code == 422
+
+
+def test_teardown_empties_every_project(client):
+    for project in ("one", "two"):
+        apply_entity(client, project, "entity", project)
+    assert descriptions(list_entities(client, "one")) == ["one"]
+
+    assert client.delete("/teardown").status_code == 200
+    assert client.get("/projects").json()["strings"] == []
+    for project in ("one", "two"):
+        assert descriptions(list_entities(client, project)) == []
@@ -0,0 +1,52 @@
+from feast.protos.feast.core.DataSource_pb2 import DataSource as DataSourceProto
+
+from feast_rest_registry import interface
+
+from tests.helpers import apply_entity, application, entity_application
+
+
+def test_get_many_across_resource_types(client):
+    apply_entity(client, "project", "a")
+    apply_entity(client, "project", "b")
+    apply_entity(client, "other", "c")
+    client.post(
+        "/project",
+        params={"resource": "data_source", "name": "source"},
+        json=application(DataSourceProto(name="source", project="project")),
+    )
+
+    response = client.post(
+        "/project/get_many",
+        json=[
+            {"resource": "entity", "name": "a"},
+            {"resource": "data_source", "name": "source"},
+            {"resource": "entity", "name": "c"},
+            {"resource": "feature_view", "name": "a"},
+        ],
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert sorted((obj["type"], obj["name"]) for obj in body["objects"]) == [
+        ("data_source", "source"), ("entity", "a")
+    ]
+    assert sorted((ref["type"], ref["name"]) for ref in body["missing"]) == [
+        ("entity", "c"), ("feature_view", "a")
+    ]
+
+
+def test_get_many_in_chunks(client):
+    names = [f"entity_{i}" for i in range(interface.GET_MANY_CHUNK_SIZE + 10)]
+    response = client.post(
+        "/project/batch",
+        json=[
+            {"resource": "entity", "name": name, "obj": entity_application(name)}
+            for name in names
+        ],
+    )
+    assert response.status_code == 200
+    body = client.post(
+        "/project/get_many",
+        json=[{"resource": "entity", "name": name} for name in names],
+    ).json()
+    assert len(body["objects"]) == len(names)
+    assert body["missing"] == []
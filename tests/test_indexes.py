@@ -0,0 +1,38 @@
+from sqlalchemy import create_engine, inspect
+
+import feast.infra.registry.sql as feast_sql_registry
+
+from feast_rest_registry import interface
+
+
+def index_names(engine, table: str) -> set:
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+
+def test_indexes_are_created(app_registry):
+    _, registry = app_registry
+    for table in ("entities", "feature_views", "managed_infra"):
+        assert {
+            f"ix_{table}_project_id_last_updated_timestamp",
+        } <= index_names(registry.engine, table)
+    assert "ix_entities_project_id_entity_name" in index_names(registry.engine, "entities")
+
+
+def test_missing_indexes_are_added(app_registry):
+    _, registry = app_registry
+    with registry.engine.begin() as conn:
+        for index in interface._registry_indexes():
+            index.drop(conn, checkfirst=True)
+    assert index_names(registry.engine, "entities") == set()
+
+    registry._create_indexes()
+    assert "ix_entities_project_id_entity_name" in index_names(registry.engine, "entities")
+
+
+def test_feast_metadata_is_left_alone(app_registry, tmp_path):
+    # Feast's own create_all makes none of the registry's indexes
+    for table in interface.RESOURCE_TABLES:
+        assert not [index for index in table.indexes if index.name.startswith("ix_")]
+    engine = create_engine(f"sqlite:///{tmp_path / 'feast.db'}")
+    feast_sql_registry.metadata.create_all(engine)
+    assert index_names(engine, "entities") == set()
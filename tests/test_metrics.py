@@ -0,0 +1,32 @@
+import gzip
+import json
+
+from tests.helpers import apply_entity, entity_application, list_entities
+
+
+def request_counts(client) -> dict:
+    counts = {}
+    for line in client.get("/metrics").text.splitlines():
+        if line.startswith("feast_rest_registry_requests_total{"):
+            labels, value = line[len("feast_rest_registry_requests_total{"):].split("} ")
+            labels = dict(label.split("=", 1) for label in labels.split(","))
+            key = (labels["method"], labels["route"].strip('"'), labels["resource"].strip('"'))
+            counts[key] = float(value)
+    return counts
+
+
+def test_requests_are_labelled_by_route(client):
+    apply_entity(client, "project", "plain")
+    client.post(
+        "/project",
+        params={"resource": "entity", "name": "compressed"},
+        content=gzip.compress(json.dumps(entity_application("compressed")).encode()),
+        headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+    )
+    list_entities(client, "project")
+
+    counts = request_counts(client)
+    # Compressed requests are counted against their route, like any other
+    assert counts[('"POST"', "/{project}", "entity")] == 2
+    assert counts[('"GET"', "/{project}/list", "entity")] == 1
+    assert not any("/project" in key[1] for key in counts)
@@ -0,0 +1,20 @@
+from feast.protos.feast.core.DataSource_pb2 import DataSource as DataSourceProto
+
+from tests.helpers import apply_entity, application
+
+
+def test_projects_across_tables(client):
+    apply_entity(client, "entities_only", "entity")
+    apply_entity(client, "both", "entity")
+    response = client.post(
+        "/sources_only",
+        params={"resource": "data_source", "name": "source"},
+        json=application(DataSourceProto(name="source", project="sources_only")),
+    )
+    assert response.status_code == 200
+
+    def projects(**params):
+        return sorted(client.get("/projects", params=params).json()["strings"])
+
+    assert projects() == ["both", "entities_only", "sources_only"]
+    assert projects(name_like="only") == ["entities_only", "sources_only"]
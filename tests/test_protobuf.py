@@ -0,0 +1,59 @@
+from feast.protos.feast.core.Entity_pb2 import Entity as EntityProto
+
+from tests.helpers import (
+    apply_entity,
+    decode_length_delimited,
+    descriptions,
+    entity_proto,
+    list_entities,
+)
+
+PROTOBUF = "application/x-protobuf"
+
+
+def test_apply_and_get_raw_proto(client):
+    proto = entity_proto("entity", "raw")
+    response = client.post(
+        "/project",
+        params={"resource": "entity", "name": "entity"},
+        content=proto.SerializeToString(),
+        headers={"Content-Type": PROTOBUF},
+    )
+    assert response.json() == {"status": "created"}
+    assert descriptions(list_entities(client, "project")) == ["raw"]
+
+    response = client.get(
+        "/project",
+        params={"resource": "entity", "name": "entity"},
+        headers={"Accept": PROTOBUF},
+    )
+    assert response.headers["content-type"] == PROTOBUF
+    assert EntityProto.FromString(response.content).spec.description == "raw"
+
+    response = client.get(
+        "/project",
+        params={"resource": "entity", "name": "missing"},
+        headers={"Accept": PROTOBUF},
+    )
+    assert response.status_code == 404
+
+
+def test_list_raw_protos(client):
+    for name in ("a", "b"):
+        apply_entity(client, "project", name, name)
+
+    response = list_entities(client, "project", headers={"Accept": PROTOBUF})
+    assert response.headers["content-type"] == PROTOBUF
+    items = decode_length_delimited(response.content)
+    assert [name for name, _ in items] == [b"a", b"b"]
+    assert [
+        EntityProto.FromString(proto_bytes).spec.description
+        for _, proto_bytes in items
+    ] == ["a", "b"]
+
+
+def test_json_remains_the_default(client):
+    apply_entity(client, "project", "entity", "json")
+    response = client.get("/project", params={"resource": "entity", "name": "entity"})
+    assert response.headers["content-type"] == "application/json"
+    assert "protostring" in response.json()
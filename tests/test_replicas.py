@@ -0,0 +1,72 @@
+import shutil
+
+import pytest
+from fastapi.testclient import TestClient
+
+from feast_rest_registry import server
+
+from tests.helpers import apply_entity, descriptions, list_entities
+
+
+@pytest.fixture
+def primary_replica(tmp_path):
+    # A primary and a replica lagging one write behind it
+    primary, replica = tmp_path / "primary.db", tmp_path / "replica.db"
+    app, registry = server.get_app(f"sqlite:///{primary}")
+    apply_entity(TestClient(app), "project", "entity", "v1")
+    registry.engine.dispose()
+    shutil.copy(primary, replica)
+
+    app, registry = server.get_app(
+        f"sqlite:///{primary}",
+        read_replica_paths=[f"sqlite:///{replica}"],
+        read_your_writes_seconds=60,
+    )
+    client = TestClient(app)
+    apply_entity(client, "project", "entity", "v2", headers={"X-Client-Id": "writer"})
+    yield client, registry, lambda: shutil.copy(primary, replica)
+    for engine in [registry.engine] + registry.read_engines:
+        engine.dispose()
+
+
+def test_replica_body_is_tagged_with_replica_version(primary_replica):
+    client, _, catch_up = primary_replica
+
+    # Others read the lagging replica, while the writer reads its own write
+    # from the primary
+    lagging = list_entities(client, "project", headers={"X-Client-Id": "reader"})
+    assert descriptions(lagging) == ["v1"]
+    written = list_entities(client, "project", headers={"X-Client-Id": "writer"})
+    assert descriptions(written) == ["v2"]
+    assert lagging.headers["etag"] != written.headers["etag"]
+
+    catch_up()
+    response = list_entities(
+        client,
+        "project",
+        headers={"X-Client-Id": "reader", "If-None-Match": lagging.headers["etag"]},
+    )
+    assert response.status_code == 200
+    assert descriptions(response) == ["v2"]
+
+
+def test_caches_serve_replica_reads_at_their_version(primary_replica):
+    client, registry, catch_up = primary_replica
+    # As once the project's version expires, to be read again from the replica
+    registry.project_versions.clear()
+
+    for _ in range(2):
+        lagging = list_entities(client, "project", headers={"X-Client-Id": "reader"})
+        assert descriptions(lagging) == ["v1"]
+    assert registry.response_cache.stats()["hits"] == 1
+
+    # Not what was cached from the replica, whose version is the cached one
+    written = list_entities(client, "project", headers={"X-Client-Id": "writer"})
+    assert descriptions(written) == ["v2"]
+    assert written.headers["etag"] != lagging.headers["etag"]
+
+    catch_up()
+    registry.project_versions.clear()
+    response = list_entities(client, "project", headers={"X-Client-Id": "reader"})
+    assert descriptions(response) == ["v2"]
+    assert response.headers["etag"] == written.headers["etag"]
@@ -0,0 +1,50 @@
+from feast.protos.feast.core.DataSource_pb2 import DataSource as DataSourceProto
+
+from tests.helpers import apply_entity, application
+
+
+def resources(client, **params):
+    response = client.get("/resources", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_pages_follow_cursors_across_resource_types(client):
+    for project in ("one", "two"):
+        for name in ("a", "b", "c"):
+            apply_entity(client, project, name)
+    client.post(
+        "/one",
+        params={"resource": "data_source", "name": "source"},
+        json=application(DataSourceProto(name="source", project="one")),
+    )
+    everything = resources(client)["resources"]
+    assert len(everything) == 7
+    assert resources(client)["next_cursor"] is None
+
+    paged, cursor = [], None
+    while True:
+        params = {"limit": 2}
+        if cursor is not None:
+            params["cursor"] = cursor
+        page = resources(client, **params)
+        assert len(page["resources"]) <= 2
+        paged += page["resources"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert paged == everything
+
+
+def test_filters(client):
+    apply_entity(client, "one", "apple")
+    apply_entity(client, "one", "banana")
+    apply_entity(client, "two", "apple")
+
+    filtered = resources(client, resource="entity", name_like="app", project="two")["resources"]
+    assert filtered == [{"name": "apple", "type": "entity", "project": "two"}]
+    assert resources(client, resource="feature_view")["resources"] == []
+
+
+def test_invalid_cursor(client):
+    assert client.get("/resources", params={"cursor": "nonsense"}).status_code == 400
@@ -0,0 +1,67 @@
+import threading
+import time
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from feast_rest_registry import server
+
+from tests.helpers import apply_entity, descriptions, list_entities
+
+
+def test_encoded_listing_is_cached_per_version(app_registry, client):
+    _, registry = app_registry
+    apply_entity(client, "project", "entity", "v1")
+    first = list_entities(client, "project")
+    entries = registry.response_cache.stats()["entries"]
+    assert entries > 0
+
+    hits = registry.response_cache.stats()["hits"]
+    assert list_entities(client, "project").content == first.content
+    assert registry.response_cache.stats()["hits"] > hits
+
+    apply_entity(client, "project", "entity", "v2")
+    assert descriptions(list_entities(client, "project")) == ["v2"]
+
+
+def test_body_read_during_commit_is_not_tagged_with_new_version(app_registry, client):
+    app, registry = app_registry
+    apply_entity(client, "project", "entity", "v1")
+
+    # Holds the next commit open, while the list below is served
+    committing = threading.Event()
+
+    @event.listens_for(registry.engine, "commit")
+    def slow_commit(conn):
+        if not committing.is_set():
+            committing.set()
+            time.sleep(0.5)
+
+    writer = threading.Thread(target=apply_entity, args=(client, "project", "entity", "v2"))
+    writer.start()
+    committing.wait(5)
+    during = list_entities(client, "project")
+    writer.join()
+
+    # The write is not yet visible while it commits, nor is its version
+    assert descriptions(during) == ["v1"]
+    after = list_entities(client, "project")
+    assert descriptions(after) == ["v2"]
+    assert during.headers["etag"] != after.headers["etag"]
+    response = list_entities(
+        client, "project", headers={"If-None-Match": during.headers["etag"]}
+    )
+    assert response.status_code == 200
+    assert descriptions(response) == ["v2"]
+
+
+def test_streams_too_large_to_cache_are_not_kept(engine_path):
+    app, registry = server.get_app(engine_path, cache_max_bytes=1024)
+    client = TestClient(app)
+    for i in range(20):
+        apply_entity(client, "project", f"entity_{i}", "x" * 100)
+
+    response = list_entities(client, "project", headers={"Accept": "application/x-ndjson"})
+    assert len(response.content) > 1024
+    assert len(response.text.splitlines()) == 20
+    assert registry.response_cache.stats()["entries"] == 0
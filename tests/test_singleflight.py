@@ -0,0 +1,123 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from feast_rest_registry import interface
+from feast_rest_registry.singleflight import SingleFlight
+from tests.helpers import apply_entity
+
+
+def run_together(fn, callers: int):
+    results = [None] * callers
+
+    def call(i):
+        results[i] = fn()
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(callers)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def wait_for(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_concurrent_calls_share_one_execution():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    executions = []
+
+    def read():
+        executions.append(1)
+        release.wait(5)
+        return "result"
+
+    threads, results = run_together(lambda: single_flight.do(("read", 1), read), 4)
+    wait_for(lambda: single_flight.stats()["coalesced"].get("read") == 3)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["result"] * 4
+    assert len(executions) == 1
+    assert single_flight.stats() == {"calls": {"read": 1}, "coalesced": {"read": 3}}
+
+    # Once done, a call runs afresh
+    assert single_flight.do(("read", 1), read) == "result"
+    assert len(executions) == 2
+
+
+def test_waiting_calls_share_the_exception():
+    single_flight = SingleFlight()
+    release = threading.Event()
+
+    def fail():
+        release.wait(5)
+        raise ValueError("failed")
+
+    errors = []
+
+    def call():
+        try:
+            single_flight.do(("fail",), fail)
+        except ValueError as err:
+            errors.append(err)
+
+    threads, _ = run_together(call, 3)
+    wait_for(lambda: single_flight.stats()["coalesced"].get("fail") == 2)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(errors) == 3
+
+
+def test_forgotten_calls_run_afresh():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    threads, _ = run_together(lambda: single_flight.do(("read", "project"), release.wait, 5), 1)
+    wait_for(lambda: single_flight.stats()["calls"].get("read") == 1)
+
+    single_flight.forget_where(lambda key: key[1] == "project")
+    assert single_flight.do(("read", "project"), lambda: "fresh") == "fresh"
+    release.set()
+    threads[0].join()
+
+
+@pytest.mark.parametrize("coalesce_reads", [True, False])
+def test_registry_coalesces_identical_listings(client, app_registry, coalesce_reads):
+    registry = app_registry[1]
+    registry.coalesce_reads = coalesce_reads
+    apply_entity(client, "project", "entity")
+
+    release = threading.Event()
+    read = registry._list_served_object_bytes_versioned
+
+    def slow_read(*args, **kwargs):
+        release.wait(5 if coalesce_reads else 0)
+        return read(*args, **kwargs)
+
+    resource = interface.QueryableResourceType("entity")
+    with mock.patch.object(
+        registry, "_list_served_object_bytes_versioned", side_effect=slow_read
+    ) as patched:
+        threads, results = run_together(
+            lambda: registry._list_served_objects(resource, "project"), 4
+        )
+        if coalesce_reads:
+            wait_for(
+                lambda: registry.single_flight.stats()["coalesced"].get(
+                    "_list_served_objects_versioned"
+                ) == 3
+            )
+        release.set()
+        for thread in threads:
+            thread.join()
+
+    assert [result.names for result in results] == [["entity"]] * 4
+    assert patched.call_count == (1 if coalesce_reads else 4)
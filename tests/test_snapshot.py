@@ -0,0 +1,28 @@
+import base64
+
+from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
+
+from tests.helpers import apply_entity
+
+
+def test_snapshot_holds_every_object(client):
+    for name in ("a", "b"):
+        apply_entity(client, "project", name, name)
+    apply_entity(client, "other", "c")
+
+    response = client.get("/project/snapshot")
+    assert response.status_code == 200
+    snapshot = RegistryProto.FromString(base64.b64decode(response.json()["protostring"]))
+    assert sorted(e.spec.name for e in snapshot.entities) == ["a", "b"]
+    assert [m.project for m in snapshot.project_metadata] == ["project"]
+
+    response = client.get("/project/snapshot", headers={"Accept": "application/x-protobuf"})
+    assert response.headers["content-type"] == "application/x-protobuf"
+    assert RegistryProto.FromString(response.content) == snapshot
+
+
+def test_snapshot_of_an_empty_project(client):
+    response = client.get("/project/snapshot")
+    assert response.status_code == 200
+    snapshot = RegistryProto.FromString(base64.b64decode(response.json()["protostring"]))
+    assert list(snapshot.entities) == []
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from feast_rest_registry import interface, server
+
+from tests.helpers import decode_length_delimited, entity_application, list_entities
+
+# More than fit in one partition of the server-side cursor
+ENTITIES = 2 * interface.STREAM_PARTITION_SIZE + 10
+
+
+@pytest.fixture
+def uncached_client(engine_path):
+    app, registry = server.get_app(engine_path, cache_max_bytes=0)
+    client = TestClient(app)
+    response = client.post(
+        "/project/batch",
+        json=[
+            {"resource": "entity", "name": f"entity_{i:03}", "obj": entity_application(f"entity_{i:03}")}
+            for i in range(ENTITIES)
+        ],
+    )
+    assert response.status_code == 200
+    yield client
+    registry.engine.dispose()
+
+
+def test_ndjson_listing_is_streamed(uncached_client):
+    response = list_entities(uncached_client, "project", headers={"Accept": "application/x-ndjson"})
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "content-length" not in response.headers
+    assert "etag" in response.headers
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["name"] for line in lines] == [f"entity_{i:03}" for i in range(ENTITIES)]
+    assert lines == [
+        {"name": name, "protostring": protostring}
+        for name, protostring in zip(
+            *list_entities(uncached_client, "project").json().values()
+        )
+    ]
+
+
+def test_protobuf_listing_is_streamed(uncached_client):
+    response = list_entities(uncached_client, "project", headers={"Accept": "application/x-protobuf"})
+    assert "content-length" not in response.headers
+    items = decode_length_delimited(response.content)
+    assert [name.decode() for name, _ in items] == [f"entity_{i:03}" for i in range(ENTITIES)]
@@ -0,0 +1,43 @@
+import threading
+import time
+
+from tests.helpers import apply_entity, list_entities
+
+
+def version_of(client, project: str) -> str:
+    return list_entities(client, project).headers["etag"].strip('"')
+
+
+def test_watch_returns_when_written(client):
+    apply_entity(client, "project", "entity", "v1")
+    version = version_of(client, "project")
+
+    response = client.get("/project/watch", params={"version": version, "timeout": 0.1})
+    assert response.json()["changed"] is False
+
+    def write():
+        time.sleep(0.2)
+        apply_entity(client, "project", "entity", "v2")
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    start = time.monotonic()
+    body = client.get("/project/watch", params={"version": version, "timeout": 10}).json()
+    writer.join()
+    assert time.monotonic() - start < 5
+    assert body["changed"] is True
+    assert body["version"] != version
+    assert [r["name"] for r in body["updated"]] == ["entity"]
+
+
+def test_watch_reports_deletions(client):
+    apply_entity(client, "project", "kept")
+    apply_entity(client, "project", "deleted")
+    version = version_of(client, "project")
+    client.delete("/project", params={"resource": "entity", "name": "deleted"})
+
+    body = client.get("/project/watch", params={"version": version, "timeout": 0}).json()
+    assert body["changed"] is True
+    # Keys written within the version's second are reported again
+    assert "deleted" not in [r["name"] for r in body["updated"]]
+    assert [r["name"] for r in body["deleted"]] == ["deleted"]
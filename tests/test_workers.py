@@ -0,0 +1,24 @@
+import threading
+
+from feast_rest_registry import interface
+
+
+def test_workers_create_tables_together(engine_path):
+    # As workers starting together on a fresh database
+    workers = 4
+    barrier = threading.Barrier(workers)
+    errors = []
+
+    def start_worker():
+        barrier.wait()
+        try:
+            interface.ServedSqlRegistry(engine_path=engine_path).engine.dispose()
+        except Exception as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=start_worker) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []